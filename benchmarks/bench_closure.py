@@ -0,0 +1,46 @@
+# benchmarks/bench_closure.py
+#
+# Compara a avaliação repetida de expressões pela StackMachine (interpretação
+# das instruções PUSH/ADD/...) com as funções de lox.closure_compiler.
+#
+# Uso: python3 benchmarks/bench_closure.py [número_de_avaliações]
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lox.lexer import Lexer
+from lox.parser import Parser
+from lox.code_generator import CodeGenerator
+from lox.stack_machine import StackMachine
+from lox.closure_compiler import compile_expression
+
+FORMULAS = [
+    "(1 + 2) * 3 - 4 / 2",
+    "(10 + 2) * (5 - 1) / 3 + 7 * (8 - 3)",
+    "2.5 * (4 + 1) / 2 - 0.75",
+    "((1 + 2) * (3 + 4) - (5 - 6) * 7) / (8 + 9 * 10)",
+    " + ".join(f"{i} * {i + 1}" for i in range(20)),
+]
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    machine = StackMachine()
+    speedups = []
+    for formula in FORMULAS:
+        instructions = CodeGenerator().generate(Parser(Lexer(formula)).parse())
+        function = compile_expression(formula)
+        assert function() == machine.execute(instructions)
+
+        interpreted = min(timeit.repeat(lambda: machine.execute(instructions), number=number, repeat=3))
+        compiled = min(timeit.repeat(function, number=number, repeat=3))
+        speedups.append(interpreted / compiled)
+        label = formula if len(formula) <= 40 else formula[:37] + "..."
+        print(f"{label:40}  pilha {interpreted / number * 1e6:8.2f} µs  "
+              f"compilada {compiled / number * 1e6:6.3f} µs  ({speedups[-1]:6.1f}x)")
+    print(f"Menor aceleração: {min(speedups):.1f}x")
+
+if __name__ == "__main__":
+    main()
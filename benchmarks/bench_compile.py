@@ -0,0 +1,46 @@
+# benchmarks/bench_compile.py
+#
+# Mede a vazão de lox.compile_many com diferentes números de threads.
+# Em um CPython com GIL a vazão fica praticamente constante; em um build
+# free-threaded (ex: python3.13t) ela deve crescer com o número de threads.
+#
+# Uso: python3 benchmarks/bench_compile.py [número_de_expressões]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import lox
+
+def random_expression(rng, depth=0):
+    """Gera uma expressão aritmética aleatória."""
+    if depth > 4 or rng.random() < 0.3:
+        return str(rng.randint(0, 1000))
+    if rng.random() < 0.2:
+        return f"({random_expression(rng, depth + 1)})"
+    op = rng.choice("+-*/")
+    return f"{random_expression(rng, depth + 1)} {op} {random_expression(rng, depth + 1)}"
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rng = random.Random(42)
+    texts = [random_expression(rng) for _ in range(count)]
+
+    gil_check = getattr(sys, '_is_gil_enabled', None)
+    gil = "habilitado" if gil_check is None or gil_check() else "desabilitado"
+    print(f"Python {sys.version.split()[0]}, GIL {gil}, {os.cpu_count()} CPUs, {count} expressões")
+
+    baseline = None
+    for threads in (1, 2, 4, 8):
+        start = time.perf_counter()
+        results = lox.compile_many(texts, max_workers=threads)
+        elapsed = time.perf_counter() - start
+        assert all(result.ok for result in results)
+        baseline = baseline or elapsed
+        print(f"  {threads} thread(s): {count / elapsed:10.0f} expressões/s  (aceleração {baseline / elapsed:.2f}x)")
+
+if __name__ == "__main__":
+    main()
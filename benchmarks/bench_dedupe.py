@@ -0,0 +1,70 @@
+# benchmarks/bench_dedupe.py
+#
+# Compara lox.compile_many com e sem `dedupe` em um lote com muitas expressões
+# equivalentes: cada expressão base aparece em variantes com operandos de '+' e
+# '*' trocados de lugar, outros espaços e parênteses redundantes. Com `dedupe`,
+# o código é gerado uma só vez por grupo de expressões equivalentes, e textos
+# que só diferem nos espaços são analisados uma só vez.
+#
+# Uso: python3 benchmarks/bench_dedupe.py [número_de_expressões_base] [variantes]
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import lox
+
+def random_tree(rng, depth=0):
+    """Gera uma expressão aleatória como árvore (operador, esquerda, direita) ou número."""
+    if depth > 4 or rng.random() < 0.3:
+        if rng.random() < 0.1:
+            return f"{rng.randint(0, 100)}.5"
+        return str(rng.randint(0, 1000))
+    return (rng.choice("+-*/"), random_tree(rng, depth + 1), random_tree(rng, depth + 1))
+
+def render(tree, variant):
+    """Escreve a árvore como texto.
+
+    A variante 0 é a expressão base; a 1 troca os operandos de '+' e '*', a 2 usa
+    outros espaços e, a partir da 3, a expressão ganha parênteses redundantes.
+    """
+    if isinstance(tree, str):
+        return tree
+    op, left, right = tree
+    left, right = render(left, variant % 3), render(right, variant % 3)
+    if variant % 3 == 1 and op in "+*":
+        left, right = right, left
+    space = "  " if variant % 3 == 2 else " "
+    text = f"({left}{space}{op}{space}{right})"
+    return "(" * (variant // 3) + text + ")" * (variant // 3)
+
+def measure(texts, dedupe):
+    """Retorna o menor tempo de três compilações do lote, em segundos."""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        results = lox.compile_many(texts, max_workers=1, dedupe=dedupe)
+        elapsed = time.perf_counter() - start
+        assert all(result.ok for result in results)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    variants = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    rng = random.Random(42)
+    trees = [random_tree(rng) for _ in range(count)]
+    texts = [render(tree, variant) for variant in range(variants) for tree in trees]
+    print(f"{len(texts)} expressões ({count} bases x {variants} variantes, textos distintos: "
+          f"{len(set(texts))}), 1 thread")
+
+    plain = measure(texts, dedupe=False)
+    deduped = measure(texts, dedupe=True)
+    print(f"  sem dedupe: {plain:6.3f} s")
+    print(f"  com dedupe: {deduped:6.3f} s  (aceleração {plain / deduped:.2f}x)")
+
+if __name__ == "__main__":
+    main()
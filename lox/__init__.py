@@ -0,0 +1,2 @@
+from .api import compile, compile_many, CompileOptions, CompileResult
+from .limits import Limits
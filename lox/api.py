@@ -0,0 +1,201 @@
+# lox/api.py
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from .lexer import Lexer
+from .parser import Parser
+from .code_generator import CodeGenerator
+from .canonical import Canonicalizer
+from .errors import CompilerError, LimitExceededError
+
+# Espaço ao redor de operadores e parênteses, que não separa tokens.
+OPERATOR_SPACE = re.compile(r" ?([-+*/()]) ?")
+
+# Opções de compilação.
+class CompileOptions:
+    """Opções aceitas por `compile`."""
+    def __init__(self, specialize=False, recover=False, limits=None):
+        """Inicializa as opções.
+
+        Args:
+            specialize (bool): Emite instruções especializadas por tipo (ver CodeGenerator).
+            recover (bool): Reúne todos os erros de sintaxe em vez de parar no primeiro.
+            limits (Limits): Limites de recursos para entradas não confiáveis (ver lox.limits).
+        """
+        self.specialize = specialize
+        self.recover = recover
+        self.limits = limits
+
+# Resultado de uma compilação.
+class CompileResult:
+    """Resultado de `compile`: o código gerado ou os erros encontrados."""
+    def __init__(self, text, ast=None, instructions=None, errors=None):
+        """Inicializa o resultado.
+
+        Args:
+            text (str): A expressão compilada.
+            ast (AST): A raiz da AST, ou None se a análise falhou.
+            instructions (list): As instruções geradas, ou None se houve erros.
+            errors (list): Os erros encontrados (CompilerError), ordenados pela posição.
+        """
+        self.text = text
+        self.ast = ast
+        self.instructions = instructions
+        self.errors = errors or []
+        self._options = None # Opções para analisar o texto só quando `ast` for lido
+
+    @property
+    def ast(self):
+        """A raiz da AST, ou None se a análise falhou.
+
+        Em `compile_many(dedupe=True)`, uma expressão que só difere de outra do lote
+        nos espaços recebe o código já gerado, e a sua própria AST só é construída
+        na primeira leitura deste atributo.
+        """
+        if self._options is not None:
+            self._ast = _parse(self.text, self._options).ast
+            self._options = None
+        return self._ast
+
+    @ast.setter
+    def ast(self, ast):
+        self._ast = ast
+        self._options = None
+
+    @property
+    def ok(self):
+        """Verdadeiro se a compilação terminou sem erros."""
+        return not self.errors
+
+    def __repr__(self):
+        if self.ok:
+            return f"CompileResult(ok, {len(self.instructions)} instruções)"
+        return f"CompileResult({len(self.errors)} erro(s))"
+
+def _parse(text, options):
+    """Executa as análises léxica e sintática e retorna um resultado ainda sem código."""
+    try:
+        lexer = Lexer(text, recover=options.recover, limits=options.limits)
+        parser = Parser(lexer, recover=options.recover)
+        ast = parser.parse()
+        errors = sorted(lexer.errors + parser.errors, key=lambda error: error.offset)
+        return CompileResult(text, ast, errors=errors)
+    except CompilerError as e:
+        return CompileResult(text, errors=[e])
+    except RecursionError:
+        # Sem `limits.max_depth`, parênteses muito aninhados esgotam a pilha do parser
+        return CompileResult(text, errors=[LimitExceededError(
+            "Profundidade de parênteses excede o limite de recursão do Python")])
+
+def compile(text, options=None):
+    """Compila uma expressão e retorna o resultado, sem imprimir nada.
+
+    Cada chamada usa seus próprios Lexer, Parser e CodeGenerator, sem estado
+    compartilhado, então a função pode ser chamada de várias threads ao mesmo tempo.
+
+    Args:
+        text (str): A expressão a ser compilada.
+        options (CompileOptions): As opções de compilação (padrão: CompileOptions()).
+
+    Returns:
+        CompileResult: O código gerado ou os erros léxicos e sintáticos (inclusive
+        LimitExceededError, quando `options.limits` é excedido).
+    """
+    options = options or CompileOptions()
+    result = _parse(text, options)
+    if result.ok:
+        result.instructions = CodeGenerator(specialize=options.specialize).generate(result.ast)
+    return result
+
+def _compile_canonical(text, options, classes):
+    """Analisa a expressão e gera o código se ela for a primeira do seu grupo.
+
+    `classes` é compartilhado entre as threads e associa a chave canônica de cada
+    grupo de expressões equivalentes ao resultado do seu representante; só o
+    representante tem o código gerado. Qualquer falha (inclusive inesperada) vira
+    um erro no resultado desta expressão, sem interromper o lote.
+
+    Returns:
+        tuple: A chave canônica (None se houve erros) e o resultado, com a AST da
+        própria expressão.
+    """
+    result = _parse(text, options)
+    if not result.ok:
+        return None, result
+    try:
+        key, _ = Canonicalizer().reduce(result.ast)
+    except CompilerError as e:
+        return None, CompileResult(text, result.ast, errors=[e])
+    except Exception as e:
+        return None, CompileResult(text, result.ast, errors=[CompilerError(f"Erro inesperado: {e}")])
+    if classes.setdefault(key, result) is result: # Atômico: um único representante por grupo
+        result.instructions = CodeGenerator(specialize=options.specialize).generate(result.ast)
+    return key, result
+
+def _normalize(text, options):
+    """Retorna o texto sem os espaços que não separam tokens.
+
+    Textos com a mesma forma normalizada têm exatamente os mesmos tokens. Textos
+    acima de `limits.max_input_size` são mantidos como estão, para que cada um
+    receba o seu próprio erro.
+    """
+    limits = options.limits
+    if limits is not None and limits.max_input_size is not None and len(text) > limits.max_input_size:
+        return text
+    return OPERATOR_SPACE.sub(r"\1", " ".join(text.split()))
+
+def compile_many(texts, options=None, max_workers=None, dedupe=False):
+    """Compila várias expressões em um conjunto de threads.
+
+    Em builds do CPython sem GIL (free-threaded) as compilações rodam em paralelo.
+
+    Com `dedupe`, o código é gerado uma única vez para cada grupo de expressões
+    equivalentes (ver lox.canonical), a partir da AST da primeira expressão
+    analisada do grupo. Expressões que só diferem nos espaços têm os mesmos
+    tokens e são analisadas uma única vez. Cada resultado recebe uma cópia das
+    instruções do grupo, que podem diferir da expressão original na ordem dos
+    operandos de '+' e '*', mas avaliam para o mesmo valor, e mantém a AST da sua
+    própria expressão (construída na primeira leitura de `ast`, se necessário).
+
+    Args:
+        texts (iterable): As expressões a serem compiladas.
+        options (CompileOptions): As opções usadas em todas as compilações.
+        max_workers (int): Número de threads (padrão do ThreadPoolExecutor).
+        dedupe (bool): Gera código uma só vez por grupo de expressões equivalentes.
+
+    Returns:
+        list: Um CompileResult para cada expressão, na mesma ordem.
+    """
+    options = options or CompileOptions()
+    texts = list(texts)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if not dedupe:
+            return list(executor.map(lambda text: compile(text, options), texts))
+
+        # Um texto analisado por forma normalizada; textos idênticos contam uma só vez
+        groups = {} # Forma normalizada -> primeiro texto com essa forma
+        representatives = {text: groups.setdefault(_normalize(text, options), text)
+                           for text in dict.fromkeys(texts)}
+        unique = list(groups.values())
+        classes = {} # Chave canônica -> resultado do representante do grupo
+        compile_text = lambda text: _compile_canonical(text, options, classes)
+        parsed = dict(zip(unique, executor.map(compile_text, unique)))
+
+        # Com erros, cada texto é analisado individualmente, com as suas próprias posições
+        failed = [text for text, representative in representatives.items()
+                  if text != representative and parsed[representative][0] is None]
+        parsed.update(zip(failed, executor.map(compile_text, failed)))
+
+    results = []
+    for text in texts:
+        key, parsed_result = parsed.get(text) or parsed[representatives[text]]
+        if text == parsed_result.text:
+            result = CompileResult(text, parsed_result.ast, errors=parsed_result.errors)
+        else:
+            result = CompileResult(text)
+            result._options = options # A AST é construída na primeira leitura
+        if key is not None:
+            result.instructions = list(classes[key].instructions)
+        results.append(result)
+    return results
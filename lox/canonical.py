@@ -0,0 +1,187 @@
+# lox/canonical.py
+
+import hashlib
+from operator import itemgetter
+
+from .lexer import Token, TokenType
+from .parser import BinOp, Num
+
+# Operadores comutativos; entre inteiros também são associativos.
+COMMUTATIVE = (TokenType.PLUS, TokenType.MULTIPLY)
+
+# Chaves maiores do que isso (em caracteres) são substituídas por um resumo de tamanho fixo.
+MAX_RAW_KEY = 32
+
+# Forma canônica de expressões, para identificar expressões equivalentes.
+class Canonicalizer:
+    """Calcula a forma canônica de uma AST.
+
+    Duas expressões têm a mesma forma canônica se diferem apenas em espaços,
+    parênteses redundantes ou na ordem dos operandos de '+' e '*'. A forma
+    canônica avalia sempre para o mesmo valor que a original:
+
+    * cadeias de '+' ou '*' entre inteiros são achatadas e os operandos ordenados
+      (`3 + (1 + 2)` equivale a `1 + 2 + 3`);
+    * entre valores de ponto flutuante a soma e o produto não são associativos,
+      então apenas os dois operandos de cada operação são ordenados;
+    * '-' e '/' mantêm a ordem dos operandos.
+
+    Uma única travessia pós-ordem (`reduce`), com pilha explícita, infere os tipos
+    e calcula de baixo para cima a chave de cada subárvore: a própria notação
+    prefixada (ex: `(+ 1 2)`) enquanto for curta, ou um resumo (hash) de
+    tamanho fixo dela. Os operandos são ordenados por essas chaves. A forma canônica
+    é representada por tuplas (operador, operandos) e números (Num); a notação
+    prefixada completa (`render`) e a AST canônica (`build`) só são montadas
+    quando pedidas.
+    """
+    def canonicalize(self, node):
+        """Retorna a chave canônica e uma nova AST na forma canônica.
+
+        Args:
+            node (AST): O nó raiz da AST.
+
+        Returns:
+            tuple: A chave canônica (str) e a AST canônica (AST).
+        """
+        _, canonical = self.reduce(node)
+        return self.render(canonical), self.build(canonical)
+
+    def reduce(self, node):
+        """Calcula a chave e a forma canônica da AST em uma única travessia.
+
+        Cada resultado é uma tupla (chave, é float, forma). Uma cadeia de '+' ou '*'
+        entre inteiros fica pendente (chave None, forma (operador, operandos)) até o
+        pai ser outra operação; então os operandos são ordenados uma única vez e a
+        chave é calculada (`_finish`).
+
+        Args:
+            node (AST): O nó raiz da AST.
+
+        Returns:
+            tuple: A chave (str, igual para expressões equivalentes e diferente,
+            exceto por colisão do resumo, para as demais) e a forma canônica.
+        """
+        results = [] # Resultados dos nós já visitados
+        pending = [node] # Nós a visitar; (nó,) indica um BinOp com os filhos já visitados
+        while pending:
+            current = pending.pop()
+            if isinstance(current, Num):
+                value = current.value
+                key = repr(value)
+                if len(key) > MAX_RAW_KEY:
+                    key = self._digest(key)
+                results.append((key, isinstance(value, float), current))
+            elif isinstance(current, BinOp):
+                pending.append((current,))
+                pending.append(current.right)
+                pending.append(current.left)
+            elif current.__class__ is tuple:
+                right = results.pop()
+                left = results.pop()
+                op = current[0].op
+                is_float = left[1] or right[1]
+                commutative = op.type in COMMUTATIVE
+                if commutative and not is_float: # Cadeia entre inteiros: junta os operandos
+                    operands = self._chain(left, op)
+                    others = self._chain(right, op)
+                    if len(operands) < len(others):
+                        operands, others = others, operands
+                    operands.extend(others)
+                    results.append((None, False, (op, operands)))
+                    continue
+                if left[0] is None or right[0] is None:
+                    left, right = self._finish(left), self._finish(right)
+                if commutative and right[0] < left[0]:
+                    left, right = right, left
+                key = f"({op.value} {left[0]} {right[0]})"
+                if len(key) > MAX_RAW_KEY:
+                    key = self._digest(key)
+                results.append((key, is_float, (op, [left[2], right[2]])))
+            else:
+                self._generic_visit(current)
+        key, _, canonical = self._finish(results[0])
+        return key, canonical
+
+    def _generic_visit(self, node):
+        """Levanta uma exceção para tipos de nós não implementados."""
+        raise Exception(f'Nenhum método _visit_{type(node).__name__} implementado')
+
+    def _chain(self, result, op):
+        """Retorna a lista de operandos de `result` como parte de uma cadeia de `op`."""
+        if result[0] is None:
+            if result[2][0].type == op.type:
+                return result[2][1]
+            result = self._finish(result)
+        return [result]
+
+    def _finish(self, result):
+        """Ordena os operandos e calcula a chave de uma cadeia pendente."""
+        if result[0] is not None:
+            return result
+        op, operands = result[2]
+        operands.sort(key=itemgetter(0))
+        key = f"({op.value} {' '.join([operand[0] for operand in operands])})"
+        if len(key) > MAX_RAW_KEY:
+            key = self._digest(key)
+        return key, False, (op, [operand[2] for operand in operands])
+
+    def _digest(self, key):
+        """Substitui uma chave longa por '#' seguido de um resumo de 16 bytes em hexadecimal.
+
+        Chaves curtas não contêm '#' e os resumos têm tamanho fixo, então chaves
+        diferentes continuam diferentes (a menos de colisão do resumo).
+        """
+        return "#" + hashlib.blake2b(key.encode('ascii'), digest_size=16).hexdigest()
+
+    def render(self, canonical):
+        """Escreve a forma canônica em notação prefixada, ex: `(+ 1 2 (* 3 4))`."""
+        parts = []
+        pending = [canonical]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, str):
+                parts.append(item)
+            elif isinstance(item, Num):
+                parts.append(repr(item.value))
+            else:
+                op, operands = item
+                sequence = [f"({op.value}"]
+                for operand in operands:
+                    sequence.extend((" ", operand))
+                sequence.append(")")
+                pending.extend(reversed(sequence))
+        return ''.join(parts)
+
+    def build(self, canonical):
+        """Constrói a AST da forma canônica; cadeias viram árvores associativas à esquerda."""
+        results = []
+        pending = [(canonical, False)] # (forma, operandos já construídos)
+        while pending:
+            form, built = pending.pop()
+            if isinstance(form, Num):
+                results.append(form)
+                continue
+            op, operands = form
+            if not built:
+                pending.append((form, True))
+                pending.extend((operand, False) for operand in reversed(operands))
+                continue
+            nodes = results[len(results) - len(operands):]
+            del results[len(results) - len(operands):]
+            node = nodes[0]
+            for operand in nodes[1:]:
+                node = BinOp(left=node, op=Token(op.type, op.value), right=operand)
+            results.append(node)
+        return results[0]
+
+def canonical_key(node):
+    """Retorna a chave canônica de uma AST (igual para expressões equivalentes)."""
+    canonicalizer = Canonicalizer()
+    return canonicalizer.render(canonicalizer.reduce(node)[1])
+
+def structural_hash(node):
+    """Retorna um hash estável (SHA-256 em hexadecimal) da forma canônica de uma AST.
+
+    O hash é o mesmo entre execuções e máquinas diferentes, ao contrário de `hash()`.
+    """
+    return hashlib.sha256(canonical_key(node).encode('utf-8')).hexdigest()
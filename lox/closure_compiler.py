@@ -0,0 +1,194 @@
+# lox/closure_compiler.py
+
+import functools
+import operator
+
+from .lexer import Lexer, TokenType
+from .parser import Parser, BinOp, Num
+from .errors import ExecutionError
+from .stack_machine import int_divide, float_divide
+from .type_checker import TypeChecker, Type
+
+# Expressões com até este número de nós são compiladas como código-fonte Python;
+# acima disso o compilador do CPython pode esgotar a recursão ou o aninhamento.
+MAX_SOURCE_NODES = 1000
+
+# Precedência dos operadores no código-fonte gerado (chamadas e números são átomos).
+SOURCE_OPERATORS = {
+    TokenType.PLUS: ('+', 1),
+    TokenType.NEG: ('-', 1),
+    TokenType.MULTIPLY: ('*', 2),
+}
+ATOM_PRECEDENCE = 3
+
+# Funções disponíveis para o código-fonte gerado.
+SOURCE_GLOBALS = {'_d': int_divide, '_fd': float_divide, '_overflow': None}
+
+# Modelo da função gerada; o estouro numérico vira ExecutionError, como na StackMachine.
+SOURCE_TEMPLATE = """def _lox():
+    try:
+        return {source}
+    except OverflowError as e:
+        raise _overflow(e) from e
+"""
+
+def _overflow(error):
+    """Converte um OverflowError do Python no ExecutionError da StackMachine."""
+    return ExecutionError(f"Estouro numérico: {error}")
+
+SOURCE_GLOBALS['_overflow'] = _overflow
+
+# Transforma a AST em funções Python.
+class ClosureCompiler:
+    """Compila uma AST em uma função Python sem argumentos que avalia a expressão.
+
+    Expressões de tamanho usual viram código-fonte Python (ex: `(1 + 2) * _d(4, 2)`)
+    compilado com `compile()`, de modo que a avaliação repetida roda como bytecode
+    nativo, sem reinterpretar instruções da máquina de pilha. Expressões grandes
+    demais para o compilador do CPython viram closures aninhadas; nelas, cadeias
+    associativas à esquerda (`1 - 2 - ... - n`) viram uma única closure que percorre
+    os operandos em um laço, sem recursão proporcional ao tamanho.
+
+    O resultado é sempre o mesmo que o da StackMachine para o código gerado,
+    inclusive os erros: divisão por zero e estouro numérico (ex: inteiro grande
+    demais para virar ponto flutuante) levantam ExecutionError. A divisão é escolhida em tempo de compilação a partir dos tipos inferidos.
+    """
+    def compile(self, node):
+        """Compila o nó raiz da AST em uma função.
+
+        Args:
+            node (AST): O nó raiz da AST.
+
+        Returns:
+            callable: Uma função sem argumentos que retorna o valor da expressão.
+        """
+        TypeChecker().check(node)
+        source = self._source(node)
+        if source is not None:
+            namespace = dict(SOURCE_GLOBALS)
+            try:
+                exec(compile(SOURCE_TEMPLATE.format(source=source), "<lox>", "exec"), namespace)
+                return namespace['_lox']
+            except (SyntaxError, RecursionError, MemoryError):
+                pass # Aninhamento demais para o compilador do CPython: usa closures
+        function = self._visit(node)
+
+        def guarded():
+            try:
+                return function()
+            except OverflowError as e:
+                raise _overflow(e) from e
+        return guarded
+
+    def _source(self, node):
+        """Gera o código-fonte Python da expressão, ou None se ela tiver nós demais.
+
+        A travessia (pós-ordem) usa uma pilha explícita; parênteses só são
+        escritos quando a precedência ou a associatividade à esquerda exigem.
+        """
+        values = [] # (código-fonte, precedência) dos nós já visitados
+        pending = [(node, False)] # (nó, filhos já visitados)
+        count = 0
+        while pending:
+            current, children_done = pending.pop()
+            count += 1
+            if count > 2 * MAX_SOURCE_NODES:
+                return None
+            if isinstance(current, BinOp) and not children_done:
+                pending.append((current, True))
+                pending.append((current.right, False))
+                pending.append((current.left, False))
+            elif isinstance(current, BinOp):
+                right, right_precedence = values.pop()
+                left, left_precedence = values.pop()
+                if current.op.type == TokenType.DIVIDE:
+                    function = '_fd' if current.type == Type.FLOAT else '_d'
+                    values.append((f"{function}({left}, {right})", ATOM_PRECEDENCE))
+                    continue
+                if current.op.type not in SOURCE_OPERATORS:
+                    raise Exception(f"Operador desconhecido: {current.op.type}")
+                symbol, precedence = SOURCE_OPERATORS[current.op.type]
+                if left_precedence < precedence:
+                    left = f"({left})"
+                if right_precedence <= precedence:
+                    right = f"({right})"
+                values.append((f"{left} {symbol} {right}", precedence))
+            elif isinstance(current, Num):
+                values.append((repr(current.value), ATOM_PRECEDENCE))
+            else:
+                self._generic_visit(current)
+        return values[0][0]
+
+    def _visit(self, node):
+        """Visita um nó da AST e chama o método de compilação apropriado."""
+        method_name = f'_visit_{type(node).__name__}'
+        visitor = getattr(self, method_name, self._generic_visit)
+        return visitor(node)
+
+    def _generic_visit(self, node):
+        """Levanta uma exceção para tipos de nós não implementados."""
+        raise Exception(f'Nenhum método _visit_{type(node).__name__} implementado')
+
+    def _visit_BinOp(self, node):
+        """Compila um nó BinOp e toda a cadeia à sua esquerda em uma closure.
+
+        Args:
+            node (BinOp): O nó BinOp a ser compilado.
+        """
+        steps = [] # (operação, closure do operando direito), da direita para a esquerda
+        while isinstance(node, BinOp):
+            steps.append((self._operation(node), self._visit(node.right)))
+            node = node.left
+        steps.reverse()
+        first = self._visit(node)
+
+        if len(steps) == 1:
+            operation, right = steps[0]
+            return lambda: operation(first(), right())
+
+        def chain():
+            value = first()
+            for operation, operand in steps:
+                value = operation(value, operand())
+            return value
+        return chain
+
+    def _operation(self, node):
+        """Retorna a função Python que implementa o operador de um nó BinOp."""
+        if node.op.type == TokenType.PLUS:
+            return operator.add
+        elif node.op.type == TokenType.NEG:
+            return operator.sub
+        elif node.op.type == TokenType.MULTIPLY:
+            return operator.mul
+        elif node.op.type == TokenType.DIVIDE:
+            return float_divide if node.type == Type.FLOAT else int_divide
+        raise Exception(f"Operador desconhecido: {node.op.type}")
+
+    def _visit_Num(self, node):
+        """Compila um nó Num em uma closure que retorna o seu valor.
+
+        Args:
+            node (Num): O nó Num a ser compilado.
+        """
+        value = node.value
+        return lambda: value
+
+@functools.lru_cache(maxsize=1024)
+def compile_expression(expression_text):
+    """Compila o texto de uma expressão em uma função, com cache por expressão.
+
+    Chamadas repetidas com o mesmo texto reutilizam a função já compilada.
+
+    Args:
+        expression_text (str): A expressão a ser compilada.
+
+    Returns:
+        callable: Uma função sem argumentos que retorna o valor da expressão.
+
+    Raises:
+        LexerError: Se ocorrer um erro durante a análise léxica.
+        ParserError: Se ocorrer um erro durante a análise sintática.
+    """
+    ast = Parser(Lexer(expression_text)).parse()
+    return ClosureCompiler().compile(ast)
@@ -2,12 +2,28 @@
 
 from .parser import BinOp, Num
 from .lexer import TokenType # Tipos de token para operadores
+from .type_checker import TypeChecker, Type
+
+# Nome base da instrução de cada operador.
+OPCODES = {
+    TokenType.PLUS: 'ADD',
+    TokenType.NEG: 'SUB',
+    TokenType.MULTIPLY: 'MUL',
+    TokenType.DIVIDE: 'DIV',
+}
 
 # Gera código para uma máquina de pilha a partir da AST.
 class CodeGenerator:
     """Gera código de máquina de pilha a partir de uma Árvore de Sintaxe Abstrata (AST)."""
-    def __init__(self):
-        """Inicializa o gerador de código."""
+    def __init__(self, specialize=False):
+        """Inicializa o gerador de código.
+
+        Args:
+            specialize (bool): Se verdadeiro, emite instruções especializadas por tipo
+                (IADD/FADD, IDIV/FDIV, ...) e conversões explícitas (I2F), de modo que
+                a máquina não precise verificar tipos durante a execução.
+        """
+        self.specialize = specialize
         self.instructions = [] # Armazena as instruções geradas
 
     def generate(self, node):
@@ -19,14 +35,78 @@ class CodeGenerator:
         Returns:
             list: Uma lista de strings, onde cada string é uma instrução da máquina de pilha.
         """
-        self.instructions = [] # Limpa instruções para cada nova geração
-        self._visit(node)
+        self.instructions = list(self.iter_generate(node)) # Nova lista a cada geração
         return self.instructions
 
+    def iter_generate(self, node):
+        """Gera as instruções uma a uma, à medida que a AST é percorrida.
+
+        A travessia usa uma pilha explícita em vez de recursão: a memória usada é
+        proporcional à profundidade da AST, e não ao número de instruções, e não há
+        limite de recursão para cadeias longas como `1 + 2 + ... + n`. A inferência
+        de tipos do modo especializado (TypeChecker) também é iterativa.
+
+        Args:
+            node (AST): O nó raiz da AST a ser percorrida.
+
+        Yields:
+            str: A próxima instrução da máquina de pilha.
+        """
+        if self.specialize:
+            TypeChecker().check(node) # Anota os nós com seus tipos
+        pending = [node] # Nós ainda não visitados e instruções prontas, do fim para o início
+        while pending:
+            item = pending.pop()
+            if isinstance(item, str):
+                yield item
+            else:
+                pending.extend(reversed(self._visit(item)))
+
+    def iter_chunks(self, node, chunk_size=65536, indent=''):
+        """Agrupa as instruções geradas em blocos de texto de tamanho limitado.
+
+        Args:
+            node (AST): O nó raiz da AST a ser percorrida.
+            chunk_size (int): Tamanho aproximado, em caracteres, de cada bloco.
+            indent (str): Prefixo adicionado a cada instrução.
+
+        Yields:
+            str: Blocos com uma instrução por linha.
+        """
+        lines = []
+        size = 0
+        for instruction in self.iter_generate(node):
+            line = f'{indent}{instruction}\n'
+            lines.append(line)
+            size += len(line)
+            if size >= chunk_size:
+                yield ''.join(lines)
+                lines = []
+                size = 0
+        if lines:
+            yield ''.join(lines)
+
+    def write(self, node, sink, chunk_size=65536, indent=''):
+        """Escreve as instruções em `sink` enquanto a AST é percorrida.
+
+        No máximo `chunk_size` caracteres (aproximadamente) ficam em memória antes
+        de cada escrita.
+
+        Args:
+            node (AST): O nó raiz da AST a ser percorrida.
+            sink: Qualquer objeto com método `write(str)` (arquivo, sys.stdout, ...).
+            chunk_size (int): Tamanho aproximado, em caracteres, de cada escrita.
+            indent (str): Prefixo adicionado a cada instrução.
+        """
+        for chunk in self.iter_chunks(node, chunk_size, indent):
+            sink.write(chunk)
+
     def _visit(self, node):
         """Visita um nó da AST e chama o método de visitação apropriado.
 
-        Este método implementa o padrão 'visitor' para percorrer a AST.
+        Este método implementa o padrão 'visitor' para percorrer a AST. Cada método
+        de visitação retorna a sequência de código do nó: instruções (str) e nós
+        filhos, que serão visitados no lugar em que aparecem.
 
         Args:
             node (AST): O nó da AST a ser visitado.
@@ -53,36 +133,51 @@ class CodeGenerator:
         """Visita um nó de operação binária (BinOp) e gera as instruções correspondentes.
 
         Gera código para os operandos esquerdo e direito, seguido da instrução do operador.
+        No modo especializado, um operando INT de uma operação FLOAT é convertido
+        com I2F logo após o seu código.
 
         Args:
             node (BinOp): O nó BinOp a ser visitado.
 
+        Returns:
+            list: Operando esquerdo, operando direito (com as conversões) e a instrução.
+
         Raises:
             Exception: Se um tipo de operador desconhecido for encontrado.
         """
-        self._visit(node.left)  # Código para o operando esquerdo
-        self._visit(node.right) # Código para o operando direito
+        code = [node.left] # Código para o operando esquerdo
+        code.extend(self._conversion(node.left, node))
+        code.append(node.right) # Código para o operando direito
+        code.extend(self._conversion(node.right, node))
 
         # Emite a instrução da operação
-        if node.op.type == TokenType.PLUS:
-            self.instructions.append('ADD')
-        elif node.op.type == TokenType.NEG:
-            self.instructions.append('SUB')
-        elif node.op.type == TokenType.MULTIPLY:
-            self.instructions.append('MUL')
-        elif node.op.type == TokenType.DIVIDE:
-            self.instructions.append('DIV')
-        else:
+        opcode = OPCODES.get(node.op.type)
+        if opcode is None:
             # Isso não deve acontecer se o parser estiver correto
-            self.error(f"Operador desconhecido: {node.op.type}")
+            raise Exception(f"Operador desconhecido: {node.op.type}")
+        if self.specialize:
+            opcode = ('F' if node.type == Type.FLOAT else 'I') + opcode
+        code.append(opcode)
+        return code
+
+    def _conversion(self, operand, node):
+        """Retorna [I2F] se o operando for INT e a operação for FLOAT (modo especializado)."""
+        if self.specialize and operand.type == Type.INT and node.type == Type.FLOAT:
+            return ['I2F']
+        return []
 
     def _visit_Num(self, node):
         """Visita um nó de número (Num) e gera uma instrução PUSH com seu valor.
 
+        Valores de ponto flutuante são escritos com `repr`, sempre distinguíveis de inteiros.
+
         Args:
             node (Num): O nó Num a ser visitado.
+
+        Returns:
+            list: A instrução PUSH.
         """
-        self.instructions.append(f'PUSH {node.value}')
+        return [f'PUSH {node.value!r}']
 
 # Exemplos de uso para testar o gerador de código.
 if __name__ == "__main__":
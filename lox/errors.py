@@ -2,10 +2,12 @@
 
 class CompilerError(Exception):
     """Classe base para erros do compilador."""
-    def __init__(self, message, line=None, column=None):
+    def __init__(self, message, line=None, column=None, offset=None, length=None):
         super().__init__(message)
         self.line = line
         self.column = column
+        self.offset = offset # Posição (índice) do início do trecho com erro
+        self.length = length # Tamanho do trecho com erro
 
     def __str__(self):
         if self.line is not None and self.column is not None:
@@ -19,3 +21,11 @@ class LexerError(CompilerError):
 class ParserError(CompilerError):
     """Erro ocorrido durante a fase de análise sintática."""
     pass
+
+class ExecutionError(CompilerError):
+    """Erro ocorrido durante a execução do código gerado (ex: divisão por zero)."""
+    pass
+
+class LimitExceededError(CompilerError):
+    """Erro levantado quando a entrada excede um limite de recursos (ver lox.limits)."""
+    pass
@@ -1,7 +1,9 @@
 import enum
+import math
 import sys
 
 from .errors import LexerError
+from .limits import check_limit, check_deadline
 
 # Define os tipos de tokens para o lexer.
 class TokenType(enum.Enum):
@@ -17,15 +19,20 @@ class TokenType(enum.Enum):
 
     # Literais
     INTEGER = 'INTEGER'   # Números inteiros (ex: 123)
+    FLOAT = 'FLOAT'       # Números de ponto flutuante (ex: 1.5)
 
     # Fim da entrada
     EOF = 'EOF'           # End Of File
 
 # Representa um token encontrado pelo lexer.
 class Token:
-    def __init__(self, type, value):
+    def __init__(self, type, value, offset=None, line=None, column=None, length=None):
         self.type = type
         self.value = value
+        self.offset = offset # Índice do primeiro caractere do token no texto
+        self.line = line     # Linha do token (começando em 1)
+        self.column = column # Coluna do token (começando em 1)
+        self.length = length # Quantidade de caracteres do token
 
     def __str__(self):
         """Retorna a representação string do token."""
@@ -37,22 +44,53 @@ class Token:
 
 # O analisador léxico que converte texto em tokens.
 class Lexer:
-    def __init__(self, text):
+    def __init__(self, text, recover=False, limits=None):
         """Inicializa o lexer com o texto de entrada.
 
         Args:
             text (str): A string de código fonte a ser analisada.
+            recover (bool): Se verdadeiro, caracteres desconhecidos são registrados
+                em `errors` e ignorados, em vez de interromper a análise.
+            limits (Limits): Limites de recursos (ver lox.limits); None para nenhum.
+                O prazo de `max_compile_time` começa a contar aqui.
+
+        Raises:
+            LimitExceededError: Se o texto exceder o tamanho máximo de entrada.
         """
+        self.limits = limits
+        self.deadline = None
+        if limits is not None:
+            check_limit(len(text), limits.max_input_size, "Tamanho da entrada")
+            self.deadline = limits.deadline()
+        self.token_count = 0    # Tokens produzidos (para o limite de tokens)
+        self.recover = recover
+        self.errors = []        # Erros registrados no modo de recuperação
         self.text = text        # O texto de entrada
         self.pos = 0            # Posição atual no texto (índice)
-        self.current_char = self.text[self.pos] # Caractere atual na posição
+        self.line = 1           # Linha atual (começando em 1)
+        self.column = 1         # Coluna atual (começando em 1)
+        self.current_char = self.text[self.pos] if self.text else None # Caractere atual na posição
 
-    def error(self, message="Erro léxico"):
-        """Levanta uma exceção LexerError com a mensagem e posição do erro."""
-        raise LexerError(message, column=self.pos)
+    def error(self, message="Erro léxico", line=None, column=None, offset=None, length=1):
+        """Levanta uma exceção LexerError com a mensagem e posição do erro.
+
+        Por padrão a posição é a do caractere atual. No modo de recuperação o
+        erro é apenas registrado em `errors`.
+        """
+        if offset is None:
+            line, column, offset = self.line, self.column, self.pos
+        error = LexerError(message, line=line, column=column, offset=offset, length=length)
+        if not self.recover:
+            raise error
+        self.errors.append(error)
 
     def advance(self):
         """Avança para o próximo caractere na entrada, ou define como None se no final."""
+        if self.current_char == '\n':
+            self.line += 1
+            self.column = 1
+        else:
+            self.column += 1
         self.pos += 1
         if self.pos > len(self.text) - 1:
             self.current_char = None  # Fim da entrada
@@ -64,17 +102,50 @@ class Lexer:
         while self.current_char is not None and self.current_char.isspace():
             self.advance()
 
-    def integer(self):
-        """Lê e retorna um número inteiro da entrada.
+    def peek(self):
+        """Retorna o próximo caractere sem avançar, ou None se no final."""
+        peek_pos = self.pos + 1
+        if peek_pos > len(self.text) - 1:
+            return None
+        return self.text[peek_pos]
+
+    def number(self):
+        """Lê um número inteiro ou de ponto flutuante da entrada.
+
+        Um ponto só faz parte do número se for seguido de um dígito (ex: `1.5`).
 
         Returns:
-            int: O valor inteiro lido.
+            tuple: O tipo do token (INTEGER ou FLOAT) e o valor lido.
+
+        Raises:
+            LexerError: Se o inteiro tiver mais dígitos do que o Python consegue converter,
+                ou se o número de ponto flutuante não for finito.
         """
+        max_length = self.limits.max_literal_length if self.limits is not None else None
+        start, line, column = self.pos, self.line, self.column
         result = ''
         while self.current_char is not None and self.current_char.isdigit():
             result += self.current_char
             self.advance()
-        return int(result)
+            check_limit(len(result), max_length, "Tamanho do número", line, column, start)
+
+        if self.current_char == '.' and self.peek() is not None and self.peek().isdigit():
+            result += self.current_char
+            self.advance()
+            while self.current_char is not None and self.current_char.isdigit():
+                result += self.current_char
+                self.advance()
+                check_limit(len(result), max_length, "Tamanho do número", line, column, start)
+            value = float(result)
+            if math.isinf(value):
+                self.error("Número de ponto flutuante muito grande", line, column, start, len(result))
+                value = 0.0 # Modo de recuperação: continua com um valor qualquer
+            return TokenType.FLOAT, value
+        try:
+            return TokenType.INTEGER, int(result)
+        except ValueError: # Mais dígitos do que int() aceita (sys.get_int_max_str_digits)
+            self.error("Número inteiro muito grande", line, column, start, len(result))
+            return TokenType.INTEGER, 0 # Modo de recuperação: continua com um valor qualquer
 
     def get_next_token(self):
         """Retorna o próximo token da entrada.
@@ -87,42 +158,54 @@ class Lexer:
 
         Raises:
             LexerError: Se um caractere desconhecido for encontrado.
+            LimitExceededError: Se o número de tokens ou o tempo de compilação exceder o limite.
         """
         while self.current_char is not None:
             if self.current_char.isspace():
                 self.skip_whitespace()
                 continue
 
+            offset, line, column = self.pos, self.line, self.column
+
+            if self.limits is not None: # O EOF não conta como token
+                self.token_count += 1
+                check_limit(self.token_count, self.limits.max_tokens, "Número de tokens",
+                            line, column, offset)
+                if self.token_count % 1024 == 0:
+                    check_deadline(self.deadline)
+
             if self.current_char.isdigit():
-                return Token(TokenType.INTEGER, self.integer())
+                token_type, value = self.number()
+                return Token(token_type, value, offset, line, column, self.pos - offset)
 
             if self.current_char == '+':
                 self.advance()
-                return Token(TokenType.PLUS, '+')
+                return Token(TokenType.PLUS, '+', offset, line, column, 1)
 
             if self.current_char == '-':
                 self.advance()
-                return Token(TokenType.NEG, '-')
+                return Token(TokenType.NEG, '-', offset, line, column, 1)
 
             if self.current_char == '*':
                 self.advance()
-                return Token(TokenType.MULTIPLY, '*')
+                return Token(TokenType.MULTIPLY, '*', offset, line, column, 1)
 
             if self.current_char == '/':
                 self.advance()
-                return Token(TokenType.DIVIDE, '/')
+                return Token(TokenType.DIVIDE, '/', offset, line, column, 1)
 
             if self.current_char == '(':
                 self.advance()
-                return Token(TokenType.LPAREN, '(')
+                return Token(TokenType.LPAREN, '(', offset, line, column, 1)
 
             if self.current_char == ')':
                 self.advance()
-                return Token(TokenType.RPAREN, ')')
+                return Token(TokenType.RPAREN, ')', offset, line, column, 1)
 
             self.error("Caractere desconhecido")
+            self.advance() # Modo de recuperação: ignora o caractere inválido
 
-        return Token(TokenType.EOF, None)
+        return Token(TokenType.EOF, None, self.pos, self.line, self.column, 0)
 
 # Exemplo de uso para testar o lexer.
 if __name__ == "__main__":
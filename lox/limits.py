@@ -0,0 +1,58 @@
+# lox/limits.py
+
+import time
+
+from .errors import LimitExceededError
+
+# Limites de recursos para a compilação de entradas não confiáveis.
+class Limits:
+    """Limites de recursos aplicados pelo Lexer e pelo Parser.
+
+    Qualquer limite pode ser None (sem limite). Ao exceder um limite, a
+    compilação é interrompida com LimitExceededError, antes do trabalho caro:
+    o tamanho da entrada é verificado antes da análise léxica, o tamanho de um
+    literal antes da sua conversão e a profundidade antes de cada nível de
+    parênteses.
+    """
+    def __init__(self, max_input_size=1_000_000, max_literal_length=100, max_depth=100,
+                 max_tokens=200_000, max_nodes=200_000, max_compile_time=1.0):
+        """Inicializa os limites.
+
+        Args:
+            max_input_size (int): Número máximo de caracteres da entrada.
+            max_literal_length (int): Número máximo de caracteres de um número.
+            max_depth (int): Número máximo de parênteses aninhados.
+            max_tokens (int): Número máximo de tokens.
+            max_nodes (int): Número máximo de nós da AST.
+            max_compile_time (float): Tempo máximo, em segundos, de análise léxica e sintática.
+        """
+        self.max_input_size = max_input_size
+        self.max_literal_length = max_literal_length
+        self.max_depth = max_depth
+        self.max_tokens = max_tokens
+        self.max_nodes = max_nodes
+        self.max_compile_time = max_compile_time
+
+    def deadline(self):
+        """Retorna o instante (time.monotonic) em que o tempo de compilação se esgota, ou None."""
+        if self.max_compile_time is None:
+            return None
+        return time.monotonic() + self.max_compile_time
+
+def check_limit(value, limit, message, line=None, column=None, offset=None):
+    """Levanta LimitExceededError se `value` passar de `limit` (None é sem limite).
+
+    Args:
+        value (int): O valor medido.
+        limit (int): O limite configurado.
+        message (str): Descrição do que foi medido.
+        line, column, offset (int): Posição do erro na entrada, se conhecida.
+    """
+    if limit is not None and value > limit:
+        raise LimitExceededError(f"{message} excede o limite de {limit}",
+                                 line=line, column=column, offset=offset)
+
+def check_deadline(deadline):
+    """Levanta LimitExceededError se o tempo de compilação `deadline` já passou."""
+    if deadline is not None and time.monotonic() > deadline:
+        raise LimitExceededError("Tempo de compilação excede o limite")
@@ -0,0 +1,142 @@
+# lox/line_index.py
+
+import bisect
+import mmap
+import os
+import struct
+
+# Cabeçalho do índice: identificador, tamanho e data de modificação (st_mtime_ns)
+# do arquivo de origem e número de linhas.
+INDEX_MAGIC = b'LOXIDX2\n'
+INDEX_HEADER = struct.Struct('<8sQQQ')
+
+def index_path_for(source_path):
+    """Retorna o caminho do arquivo de índice (sidecar) de um arquivo de expressões."""
+    return source_path + '.idx'
+
+def build_index(source_path, index_path=None):
+    """Constrói o índice de deslocamentos das linhas de um arquivo de expressões.
+
+    O índice é um arquivo binário com o cabeçalho seguido do deslocamento (em
+    bytes, 8 bytes cada) do início de cada linha e, por último, do tamanho do
+    arquivo, de forma que a linha N ocupa os bytes [início(N), início(N+1)).
+
+    Args:
+        source_path (str): O arquivo com uma expressão por linha.
+        index_path (str): Onde gravar o índice (padrão: `<arquivo>.idx`).
+
+    Returns:
+        str: O caminho do índice gravado.
+    """
+    index_path = index_path or index_path_for(source_path)
+    stat = os.stat(source_path)
+    size, mtime = stat.st_size, stat.st_mtime_ns
+    with open(source_path, 'rb') as source, open(index_path, 'wb') as index:
+        index.write(INDEX_HEADER.pack(INDEX_MAGIC, size, mtime, 0))
+        count = 0
+        if size > 0:
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                offsets = [0]
+                position = data.find(b'\n')
+                while position != -1 and position + 1 < size:
+                    offsets.append(position + 1)
+                    if len(offsets) >= 65536: # Grava em blocos para limitar a memória
+                        index.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+                        count += len(offsets)
+                        offsets = []
+                    position = data.find(b'\n', position + 1)
+                offsets.append(size) # Fim da última linha
+                index.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+                count += len(offsets) - 1
+        else:
+            index.write(struct.pack('<Q', 0))
+        index.seek(0)
+        index.write(INDEX_HEADER.pack(INDEX_MAGIC, size, mtime, count))
+    return index_path
+
+# Acesso aleatório às linhas de um arquivo grande através do índice.
+class LineIndex:
+    """Lê linhas de um arquivo de expressões usando o índice de deslocamentos.
+
+    Tanto o arquivo quanto o índice são mapeados em memória (mmap), então abrir
+    o índice e ler uma linha não exige percorrer o arquivo.
+    As linhas são numeradas a partir de 1.
+    """
+    def __init__(self, source_path, index_path=None):
+        """Abre o arquivo de expressões e o seu índice.
+
+        Args:
+            source_path (str): O arquivo com uma expressão por linha.
+            index_path (str): O índice (padrão: `<arquivo>.idx`).
+
+        Raises:
+            ValueError: Se o índice for inválido ou estiver desatualizado.
+        """
+        index_path = index_path or index_path_for(source_path)
+        with open(index_path, 'rb') as index:
+            self._index_map = mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, size, mtime, count = INDEX_HEADER.unpack_from(self._index_map)
+        if magic != INDEX_MAGIC:
+            self._index_map.close()
+            raise ValueError(f"Índice inválido: {index_path}")
+        stat = os.stat(source_path)
+        if (size, mtime) != (stat.st_size, stat.st_mtime_ns):
+            self._index_map.close()
+            raise ValueError(f"Índice desatualizado para {source_path}; reconstrua com --index")
+
+        self.size = size
+        self.count = count
+        self.offsets = memoryview(self._index_map)[INDEX_HEADER.size:].cast('Q')
+        self._data = None
+        if size > 0:
+            with open(source_path, 'rb') as source:
+                self._data = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        """Retorna o número de linhas do arquivo."""
+        return self.count
+
+    def line(self, number):
+        """Retorna o texto da linha `number` (começando em 1), sem a quebra de linha.
+
+        Raises:
+            IndexError: Se a linha não existir.
+        """
+        if not 1 <= number <= self.count:
+            raise IndexError(f"Linha {number} fora do arquivo (1 a {self.count})")
+        start = self.offsets[number - 1]
+        end = self.offsets[number]
+        return self._data[start:end].decode('utf-8').rstrip('\r\n')
+
+    def lines(self, first, last):
+        """Gera os pares (número, texto) das linhas de `first` até `last`, inclusive."""
+        for number in range(max(first, 1), min(last, self.count) + 1):
+            yield number, self.line(number)
+
+    def shards(self, count):
+        """Divide o arquivo em `count` intervalos de linhas com quantidades de bytes semelhantes.
+
+        Returns:
+            list: Pares (primeira, última) de números de linha, inclusive. Intervalos
+            vazios são omitidos.
+        """
+        boundaries = [1]
+        for shard in range(1, count):
+            # Primeira linha que começa depois da fração `shard/count` dos bytes
+            target = self.size * shard // count
+            boundaries.append(max(bisect.bisect_left(self.offsets, target, 0, self.count) + 1, boundaries[-1]))
+        boundaries.append(self.count + 1)
+        return [(start, end - 1) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+    def close(self):
+        """Libera os mapeamentos de memória."""
+        self.offsets.release()
+        self._index_map.close()
+        if self._data is not None:
+            self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
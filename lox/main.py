@@ -4,8 +4,10 @@ import sys
 import os
 
 from .lexer import Lexer, TokenType
-from .parser import Parser
+from .parser import Parser, find_errors
 from .code_generator import CodeGenerator
+from .parallel import compile_parallel
+from .line_index import build_index, index_path_for, LineIndex
 from .errors import LexerError, ParserError # Exceções personalizadas
 
 def run_compiler(expression_text):
@@ -47,10 +49,9 @@ def run_compiler(expression_text):
         # Geração de Código
         code_generator = CodeGenerator()
         print("\nGerando Código para Máquina de Pilha...")
-        instructions = code_generator.generate(ast)
         print("  Código Gerado:")
-        for instr in instructions:
-            print(f"    {instr}")
+        # Escreve o código à medida que é gerado, sem montar a lista inteira
+        code_generator.write(ast, sys.stdout, indent="    ")
 
     except LexerError as e:
         print(f"\n!!! ERRO LÉXICO: {e}", file=sys.stderr)
@@ -59,6 +60,47 @@ def run_compiler(expression_text):
     except Exception as e:
         print(f"\n!!! ERRO INESPERADO: {e}", file=sys.stderr)
 
+def run_checker(expression_text, first_line=1):
+    """Valida uma expressão e informa todos os erros encontrados de uma só vez.
+
+    Args:
+        expression_text (str): A string contendo a expressão a ser validada.
+        first_line (int): O número, no arquivo, da primeira linha da expressão
+            (usado ao validar linhas avulsas de um arquivo indexado).
+
+    Returns:
+        bool: Verdadeiro se a expressão não contém erros.
+    """
+    try:
+        errors = find_errors(expression_text)
+    except Exception as e:
+        print(f"\n!!! ERRO INESPERADO: {e}", file=sys.stderr)
+        return False
+    for error in errors:
+        if error.line is not None:
+            error.line += first_line - 1
+        print(error, file=sys.stderr)
+    if not errors:
+        print("Nenhum erro encontrado.")
+    return not errors
+
+def run_parallel_compiler(expression_text, jobs):
+    """Compila uma expressão grande usando vários processos e imprime apenas o código gerado.
+
+    Args:
+        expression_text (str): A string contendo a expressão a ser compilada.
+        jobs (int): O número de processos.
+    """
+    try:
+        for instr in compile_parallel(expression_text, jobs=jobs):
+            print(instr)
+    except LexerError as e:
+        print(f"\n!!! ERRO LÉXICO: {e}", file=sys.stderr)
+    except ParserError as e:
+        print(f"\n!!! ERRO DE SINTAXE: {e}", file=sys.stderr)
+    except Exception as e:
+        print(f"\n!!! ERRO INESPERADO: {e}", file=sys.stderr)
+
 def main():
     """Ponto de entrada principal do compilador Lox.
 
@@ -66,23 +108,104 @@ def main():
     e um modo interativo (REPL).
     """
     args = sys.argv[1:]
+    usage = ("Uso: python3 -m lox.main [--check] [--jobs N] "
+             "[--index] [--lines N | --lines A:B | --lines A:] [--shard K/N] "
+             "[-f <caminho_do_arquivo> | <expressão>]")
+
+    # Opções: --check (apenas valida a entrada, listando todos os erros de uma vez),
+    # --jobs N (compila expressões grandes em N processos) e, para arquivos com uma
+    # expressão por linha, --index (constrói o índice de linhas), --lines e --shard
+    # (processam apenas algumas linhas, usando o índice; `--lines A:` vai até o fim).
+    check_only = False
+    jobs = None
+    build_only = False
+    line_range = None
+    shard = None
+    try:
+        while len(args) > 0 and args[0].startswith("--"):
+            option = args.pop(0)
+            if option == "--check":
+                check_only = True
+            elif option == "--jobs":
+                jobs = int(args.pop(0))
+                if jobs < 1:
+                    raise ValueError(jobs)
+            elif option == "--index":
+                build_only = True
+            elif option == "--lines":
+                first, colon, last = args.pop(0).partition(":")
+                if colon and not last:
+                    line_range = (int(first), None) # Até o fim do arquivo
+                else:
+                    line_range = (int(first), int(last or first))
+            elif option == "--shard":
+                number, _, total = args.pop(0).partition("/")
+                shard = (int(number), int(total))
+                if not 1 <= shard[0] <= shard[1]:
+                    raise ValueError(shard)
+            else:
+                raise ValueError(option)
+    except (IndexError, ValueError):
+        print(usage, file=sys.stderr)
+        sys.exit(1)
+
+    def process(expression_text, first_line=1):
+        """Processa uma expressão conforme as opções; retorna falso se a validação falhar."""
+        if check_only:
+            return run_checker(expression_text, first_line)
+        if jobs is not None:
+            run_parallel_compiler(expression_text, jobs)
+        else:
+            run_compiler(expression_text)
+        return True
 
     if len(args) > 0:
         # Modo de linha de comando
         expression_input = " ".join(args)
         if expression_input.startswith("-f"): # Leitura de arquivo
             if len(args) < 2:
-                print("Uso: python3 -m lox.main -f <caminho_do_arquivo>", file=sys.stderr)
+                print(usage, file=sys.stderr)
                 sys.exit(1)
             file_path = args[1]
             if not os.path.exists(file_path):
                 print(f"Erro: Arquivo não encontrado: {file_path}", file=sys.stderr)
                 sys.exit(1)
+
+            if build_only or line_range or shard:
+                # Acesso por linha através do índice (construído se ainda não existir)
+                if build_only or not os.path.exists(index_path_for(file_path)):
+                    print(f"Índice gravado em {build_index(file_path)}", file=sys.stderr)
+                if build_only and not (line_range or shard):
+                    return
+                try:
+                    index = LineIndex(file_path)
+                except ValueError as e:
+                    print(f"Erro: {e}", file=sys.stderr)
+                    sys.exit(1)
+                with index:
+                    if line_range and line_range[1] is None:
+                        line_range = (line_range[0], len(index))
+                    if shard:
+                        shards = dict(enumerate(index.shards(shard[1]), start=1))
+                        first, last = shards.get(shard[0], (1, 0))
+                        if line_range: # Interseção com --lines
+                            first, last = max(first, line_range[0]), min(last, line_range[1])
+                    else:
+                        first, last = line_range
+                    ok = True
+                    for number, line in index.lines(first, last):
+                        if line.strip(): # Ignora linhas vazias
+                            print(f"\n=== Linha {number} ===")
+                            ok = process(line, number) and ok
+                sys.exit(0 if ok else 1)
+
             with open(file_path, 'r', encoding='utf-8') as f:
-                expression_to_process = f.read()
-            run_compiler(expression_to_process)
-        else:
-            run_compiler(expression_input)
+                expression_input = f.read()
+
+        if build_only or line_range or shard:
+            print(usage, file=sys.stderr) # Essas opções exigem um arquivo (-f)
+            sys.exit(1)
+        sys.exit(0 if process(expression_input) else 1)
     else:
         # Modo Interativo (REPL - Read-Eval-Print Loop)
         print("Bem-vindo ao Gerador de Código de Expressões Aritméticas!")
@@ -0,0 +1,155 @@
+# lox/parallel.py
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from .lexer import Lexer, TokenType
+from .parser import Parser
+from .code_generator import CodeGenerator, OPCODES
+from .type_checker import Type
+from .errors import CompilerError
+
+# Caracteres relevantes para a pré-varredura: parênteses e operadores de adição/subtração.
+_SCAN_PATTERN = re.compile(r'[()+\-]')
+
+def split_terms(text):
+    """Encontra as posições dos operadores '+' e '-' fora de parênteses.
+
+    A varredura olha apenas para os caracteres, sem criar tokens, e por isso é
+    bem mais rápida que o lexer. Caracteres inválidos são detectados depois,
+    pelo lexer de cada parte.
+
+    Args:
+        text (str): A expressão completa.
+
+    Returns:
+        list: Os índices dos operadores de nível superior, ou None se os
+        parênteses estiverem desbalanceados.
+    """
+    boundaries = []
+    depth = 0
+    for match in _SCAN_PATTERN.finditer(text):
+        char = match.group()
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth < 0:
+                return None
+        elif depth == 0:
+            boundaries.append(match.start())
+    if depth != 0:
+        return None
+    return boundaries
+
+def _compile_chunk(chunk_text, first, specialize):
+    """Gera o código de cada termo de um trecho da expressão (executado em outro processo).
+
+    O trecho é uma sequência de termos separados por '+'/'-'; exceto no primeiro
+    trecho, ele começa com o operador que o liga ao trecho anterior.
+
+    Returns:
+        list: Tuplas (operador, instruções, tipo) para cada termo, onde operador é o
+        nome do TokenType que precede o termo (ou None para o primeiro termo).
+    """
+    parser = Parser(Lexer(chunk_text))
+    generator = CodeGenerator(specialize=specialize)
+    terms = []
+    op = None
+    if not first:
+        op = parser.current_token.type
+        parser.eat(op)
+    while True:
+        node = parser.term()
+        instructions = list(generator.generate(node))
+        term_type = node.type.value if specialize else None
+        terms.append((op.name if op else None, instructions, term_type))
+        if parser.current_token.type == TokenType.EOF:
+            return terms
+        if parser.current_token.type not in (TokenType.PLUS, TokenType.NEG):
+            parser.error("Caracteres extras após a expressão")
+        op = parser.current_token.type
+        parser.eat(op)
+
+def _join_terms(terms, specialize):
+    """Junta o código dos termos na ordem associativa à esquerda da expressão.
+
+    Produz as mesmas instruções que o CodeGenerator produziria para a árvore
+    ((t0 op1 t1) op2 t2) ..., inclusive as conversões I2F no modo especializado.
+    """
+    instructions = []
+    current_type = None
+    for op_name, code, term_type in terms:
+        if op_name is None:
+            instructions.extend(code)
+            current_type = term_type
+            continue
+
+        opcode = OPCODES[TokenType[op_name]]
+        if specialize:
+            result_type = Type.FLOAT.value if Type.FLOAT.value in (current_type, term_type) else Type.INT.value
+            if current_type != result_type:
+                instructions.append('I2F')
+            instructions.extend(code)
+            if term_type != result_type:
+                instructions.append('I2F')
+            opcode = ('F' if result_type == Type.FLOAT.value else 'I') + opcode
+            current_type = result_type
+        else:
+            instructions.extend(code)
+        instructions.append(opcode)
+    return instructions
+
+def compile_parallel(expression_text, jobs=None, specialize=False, min_chunk_size=65536):
+    """Compila uma expressão grande dividindo-a entre vários processos.
+
+    A expressão é dividida nos operadores '+'/'-' de nível superior; cada processo
+    gera o código dos seus termos e as partes são unidas na ordem original. O
+    resultado é idêntico ao da compilação sequencial. Entradas pequenas (ou com
+    parênteses desbalanceados) são compiladas sequencialmente.
+
+    Args:
+        expression_text (str): A expressão a ser compilada.
+        jobs (int): Número de processos (padrão: número de CPUs).
+        specialize (bool): Emite instruções especializadas por tipo (ver CodeGenerator).
+        min_chunk_size (int): Tamanho mínimo, em caracteres, de cada trecho.
+
+    Returns:
+        list: As instruções da máquina de pilha.
+
+    Raises:
+        LexerError: Se ocorrer um erro durante a análise léxica.
+        ParserError: Se ocorrer um erro durante a análise sintática.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    boundaries = split_terms(expression_text)
+    if not boundaries or len(expression_text) < 2 * min_chunk_size:
+        return _compile_sequential(expression_text, specialize)
+
+    # Agrupa os termos em trechos contíguos de tamanho semelhante
+    chunk_size = max(min_chunk_size, len(expression_text) // jobs)
+    starts = [0]
+    for boundary in boundaries:
+        if boundary - starts[-1] >= chunk_size:
+            starts.append(boundary)
+    ends = starts[1:] + [len(expression_text)]
+    chunks = [expression_text[start:end] for start, end in zip(starts, ends)]
+    if len(chunks) == 1:
+        return _compile_sequential(expression_text, specialize)
+
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = executor.map(_compile_chunk, chunks,
+                                   [index == 0 for index in range(len(chunks))],
+                                   [specialize] * len(chunks))
+            terms = [term for chunk_terms in results for term in chunk_terms]
+    except CompilerError:
+        # Recompila sequencialmente para informar o erro com a posição exata
+        return _compile_sequential(expression_text, specialize)
+    return _join_terms(terms, specialize)
+
+def _compile_sequential(expression_text, specialize):
+    """Compila a expressão inteira em um único processo."""
+    ast = Parser(Lexer(expression_text)).parse()
+    return CodeGenerator(specialize=specialize).generate(ast)
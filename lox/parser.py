@@ -1,8 +1,9 @@
 # lox/parser.py
 
-from .lexer import TokenType, Token
+from .lexer import Lexer, TokenType, Token
 import sys
-from .errors import ParserError # Importa a exceção personalizada
+from .errors import CompilerError, ParserError, LimitExceededError # Exceções personalizadas
+from .limits import check_limit, check_deadline
 
 # Classes para a Árvore de Sintaxe Abstrata (AST).
 # Cada classe representa um nó na árvore.
@@ -28,41 +29,125 @@ class BinOp(AST):
         return f"BinOp({repr(self.left)}, {self.op.value}, {repr(self.right)})"
 
 class Num(AST):
-    """Representa um número inteiro na AST."""
+    """Representa um número (inteiro ou de ponto flutuante) na AST."""
     def __init__(self, token):
         """Inicializa um nó de número.
 
         Args:
-            token (Token): O token INTEGER que contém o valor numérico.
+            token (Token): O token INTEGER ou FLOAT que contém o valor numérico.
         """
         self.token = token
         self.value = token.value # O valor numérico
     def __repr__(self):
         return f"Num({self.value})"
 
+class ErrorNode(AST):
+    """Representa um trecho inválido da entrada (usado apenas no modo de recuperação)."""
+    def __init__(self, token):
+        """Inicializa um nó de erro.
+
+        Args:
+            token (Token): O token onde o erro foi encontrado.
+        """
+        self.token = token
+    def __repr__(self):
+        return "ErrorNode()"
+
+# Tokens usados para ressincronizar o parser após um erro no modo de recuperação.
+SYNC_TOKENS = (TokenType.PLUS, TokenType.NEG, TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.RPAREN)
+
 # O Parser constrói a AST a partir dos tokens.
 class Parser:
     """O analisador sintático que constrói a Árvore de Sintaxe Abstrata (AST)."""
-    def __init__(self, lexer):
+    def __init__(self, lexer, recover=False):
         """Inicializa o parser com uma instância do lexer.
 
         Args:
             lexer (Lexer): Uma instância do analisador léxico.
+            recover (bool): Se verdadeiro, os erros de sintaxe são registrados em
+                `errors` e a análise continua (recuperação em modo pânico), em vez
+                de parar no primeiro erro.
+
+        Os limites de recursos (profundidade, número de nós e tempo) são os do lexer.
         """
         self.lexer = lexer
+        self.limits = lexer.limits
+        self.depth = 0      # Parênteses abertos no ponto atual da análise
+        self.node_count = 0 # Nós da AST criados
+        self.recover = recover
+        self.errors = [] # Erros registrados no modo de recuperação
         # O primeiro token da entrada.
         self.current_token = self.lexer.get_next_token()
 
     def error(self, message="Erro de sintaxe"):
         """Levanta uma exceção ParserError com detalhes sobre o erro sintático.
 
+        No modo de recuperação o erro é apenas registrado em `errors`, exceto
+        quando já existe um erro na mesma posição (evita erros em cascata).
+
         Args:
             message (str): A mensagem de erro.
         
         Raises:
-            ParserError: Sempre levanta uma ParserError com a mensagem formatada.
+            ParserError: Fora do modo de recuperação, com a mensagem formatada e a posição do token.
+        """
+        token = self.current_token
+        error = ParserError(f"{message} em '{token.value}' do tipo {token.type}",
+                            line=token.line, column=token.column,
+                            offset=token.offset, length=token.length)
+        if not self.recover:
+            raise error
+        if not self.errors or self.errors[-1].offset != token.offset:
+            self.errors.append(error)
+
+    def _count_node(self):
+        """Contabiliza um novo nó da AST e verifica os limites de nós e de tempo.
+
+        Raises:
+            LimitExceededError: Se o número de nós ou o tempo de compilação exceder o limite.
+        """
+        if self.limits is None:
+            return
+        self.node_count += 1
+        token = self.current_token
+        check_limit(self.node_count, self.limits.max_nodes, "Número de nós da AST",
+                    token.line, token.column, token.offset)
+        if self.node_count % 1024 == 0:
+            check_deadline(self.lexer.deadline)
+
+    def synchronize(self):
+        """Descarta tokens até um ponto seguro para continuar a análise.
+
+        Sempre descarta o token atual (o que causou o erro) e para no próximo
+        operador ou ')' fora de parênteses abertos durante o descarte, ou no EOF.
+        """
+        depth = 0
+        skipped = False
+        while self.current_token.type != TokenType.EOF:
+            token_type = self.current_token.type
+            if skipped and depth == 0 and token_type in SYNC_TOKENS:
+                break
+            if token_type == TokenType.LPAREN:
+                depth += 1
+            elif token_type == TokenType.RPAREN and depth > 0:
+                depth -= 1
+            self.current_token = self.lexer.get_next_token()
+            skipped = True
+
+    def _recover_until(self, token_type, node, message):
+        """Registra e descarta tokens inesperados até encontrar `token_type` ou EOF.
+
+        Após cada ressincronização, continua a análise dos operadores restantes
+        usando `node` como operando esquerdo. Fora do modo de recuperação não faz nada.
+
+        Returns:
+            AST: O nó resultante da análise dos operadores restantes.
         """
-        raise ParserError(f"{message} em '{self.current_token.value}' do tipo {self.current_token.type}")
+        while self.recover and self.current_token.type not in (token_type, TokenType.EOF):
+            self.error(message)
+            self.synchronize()
+            node = self._expr_rest(self._term_rest(node))
+        return node
 
     def eat(self, token_type):
         """Consome o token atual se ele corresponder ao tipo esperado e avança.
@@ -80,23 +165,31 @@ class Parser:
 
     def factor(self):
         """
-        Analisa um 'factor' da gramática: INTEGER | LPAREN expr RPAREN.
-        Lida com números inteiros e expressões agrupadas por parênteses.
+        Analisa um 'factor' da gramática: INTEGER | FLOAT | LPAREN expr RPAREN.
+        Lida com números e expressões agrupadas por parênteses.
 
         Returns:
             AST: Um nó Num ou um nó AST que representa a expressão dentro dos parênteses.
         """
         token = self.current_token
-        if token.type == TokenType.INTEGER:
-            self.eat(TokenType.INTEGER)
+        if token.type in (TokenType.INTEGER, TokenType.FLOAT):
+            self.eat(token.type)
+            self._count_node()
             return Num(token)
         elif token.type == TokenType.LPAREN:
+            if self.limits is not None:
+                check_limit(self.depth + 1, self.limits.max_depth, "Profundidade de parênteses",
+                            token.line, token.column, token.offset)
             self.eat(TokenType.LPAREN)
+            self.depth += 1
             node = self.expr() # Chama expr recursivamente para a subexpressão
+            node = self._recover_until(TokenType.RPAREN, node, f"Esperado token '{TokenType.RPAREN}'")
             self.eat(TokenType.RPAREN)
+            self.depth -= 1
             return node
         else:
             self.error("Esperado um número ou '('")
+            return ErrorNode(token) # Modo de recuperação: o token não é consumido
 
     def term(self):
         """
@@ -106,8 +199,10 @@ class Parser:
         Returns:
             AST: Um nó AST que representa o termo analisado.
         """
-        node = self.factor()
+        return self._term_rest(self.factor())
 
+    def _term_rest(self, node):
+        """Analisa a parte ((MULTIPLY | DIVIDE) factor)* de um 'term', a partir de `node`."""
         while self.current_token.type in (TokenType.MULTIPLY, TokenType.DIVIDE):
             token = self.current_token
             if token.type == TokenType.MULTIPLY:
@@ -116,6 +211,7 @@ class Parser:
                 self.eat(TokenType.DIVIDE)
 
             node = BinOp(left=node, op=token, right=self.factor())
+            self._count_node()
         return node
 
     def expr(self):
@@ -127,8 +223,10 @@ class Parser:
         Returns:
             AST: Um nó AST que representa a expressão analisada.
         """
-        node = self.term()
+        return self._expr_rest(self.term())
 
+    def _expr_rest(self, node):
+        """Analisa a parte ((PLUS | NEG) term)* de uma 'expr', a partir de `node`."""
         while self.current_token.type in (TokenType.PLUS, TokenType.NEG):
             token = self.current_token
             if token.type == TokenType.PLUS:
@@ -137,6 +235,7 @@ class Parser:
                 self.eat(TokenType.NEG)
 
             node = BinOp(left=node, op=token, right=self.term())
+            self._count_node()
         return node
 
     def parse(self):
@@ -146,14 +245,45 @@ class Parser:
         Returns:
             AST: O nó raiz da Árvore de Sintaxe Abstrata (AST).
 
+        No modo de recuperação, a AST pode conter nós ErrorNode e os erros
+        encontrados ficam em `errors`.
+
         Raises:
             ParserError: Se houver caracteres extras após a expressão válida.
         """
         node = self.expr()
+        node = self._recover_until(TokenType.EOF, node, "Caracteres extras após a expressão")
         if self.current_token.type != TokenType.EOF:
             self.error("Caracteres extras após a expressão")
         return node
 
+def find_errors(text):
+    """Analisa o texto em modo de recuperação e retorna todos os erros de uma vez.
+
+    Args:
+        text (str): A expressão a ser validada.
+
+    Erros que interrompem a análise mesmo no modo de recuperação (ex: parênteses
+    aninhados além do limite de recursão do Python) são incluídos na lista,
+    junto com os erros encontrados até ali.
+
+    Returns:
+        list: Os erros (LexerError/ParserError/LimitExceededError), ordenados pela
+        posição; erros sem posição ficam no final.
+    """
+    lexer = Lexer(text, recover=True)
+    parser = None
+    fatal = []
+    try:
+        parser = Parser(lexer, recover=True) # Já lê o primeiro token
+        parser.parse()
+    except CompilerError as e:
+        fatal.append(e)
+    except RecursionError:
+        fatal.append(LimitExceededError("Profundidade de parênteses excede o limite de recursão do Python"))
+    errors = lexer.errors + (parser.errors if parser else []) + fatal
+    return sorted(errors, key=lambda error: (error.offset is None, error.offset or 0))
+
 # Exemplos de uso para testar o parser.
 if __name__ == "__main__":
     from lexer import Lexer, TokenType
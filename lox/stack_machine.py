@@ -0,0 +1,106 @@
+# lox/stack_machine.py
+
+from .errors import ExecutionError
+
+def int_divide(left, right):
+    """Divide dois inteiros com a semântica da instrução IDIV.
+
+    A divisão entre inteiros trunca o resultado em direção a zero (como em C),
+    e não em direção a menos infinito como o operador `//` do Python.
+
+    Args:
+        left (int): O dividendo.
+        right (int): O divisor.
+
+    Returns:
+        int: O quociente truncado.
+
+    Raises:
+        ExecutionError: Se o divisor for zero.
+    """
+    if right == 0:
+        raise ExecutionError("Divisão por zero")
+    quotient = abs(left) // abs(right)
+    if (left < 0) != (right < 0):
+        return -quotient
+    return quotient
+
+def float_divide(left, right):
+    """Divide dois valores de ponto flutuante com a semântica da instrução FDIV.
+
+    Raises:
+        ExecutionError: Se o divisor for zero.
+    """
+    if right == 0:
+        raise ExecutionError("Divisão por zero")
+    return left / right
+
+def divide(left, right):
+    """Divide dois valores com a semântica da instrução genérica DIV.
+
+    Entre inteiros equivale a IDIV; se algum operando for de ponto flutuante, a FDIV.
+    """
+    if isinstance(left, float) or isinstance(right, float):
+        return float_divide(left, right)
+    return int_divide(left, right)
+
+# Operações binárias de cada instrução (genéricas e especializadas por tipo).
+OPERATIONS = {
+    'ADD': lambda left, right: left + right,
+    'SUB': lambda left, right: left - right,
+    'MUL': lambda left, right: left * right,
+    'DIV': divide,
+    'IADD': lambda left, right: left + right,
+    'ISUB': lambda left, right: left - right,
+    'IMUL': lambda left, right: left * right,
+    'IDIV': int_divide,
+    'FADD': lambda left, right: left + right,
+    'FSUB': lambda left, right: left - right,
+    'FMUL': lambda left, right: left * right,
+    'FDIV': float_divide,
+}
+
+# Executa as instruções geradas pelo CodeGenerator.
+class StackMachine:
+    """Interpretador de referência para o código da máquina de pilha hipotética."""
+    def __init__(self):
+        """Inicializa a máquina com uma pilha vazia."""
+        self.stack = []
+
+    def execute(self, instructions):
+        """Executa uma lista de instruções e retorna o valor no topo da pilha.
+
+        Args:
+            instructions (list): As instruções geradas pelo CodeGenerator.
+
+        Returns:
+            int | float: O resultado da avaliação da expressão.
+
+        Raises:
+            ExecutionError: Em divisão por zero, instrução desconhecida ou inteiro
+                grande demais para ser convertido em ponto flutuante.
+        """
+        self.stack = [] # Limpa a pilha para cada nova execução
+        try:
+            self._run(instructions)
+        except OverflowError as e:
+            raise ExecutionError(f"Estouro numérico: {e}") from e
+        return self.stack.pop()
+
+    def _run(self, instructions):
+        """Executa as instruções, deixando o resultado no topo da pilha."""
+        for instruction in instructions:
+            opcode, _, argument = instruction.partition(' ')
+            if opcode == 'PUSH':
+                self.stack.append(int(argument) if argument.isdigit() else float(argument))
+                continue
+            if opcode == 'I2F':
+                self.stack.append(float(self.stack.pop()))
+                continue
+
+            operation = OPERATIONS.get(opcode)
+            if operation is None:
+                raise ExecutionError(f"Instrução desconhecida: {instruction}")
+            right = self.stack.pop()
+            left = self.stack.pop()
+            self.stack.append(operation(left, right))
@@ -0,0 +1,67 @@
+# lox/type_checker.py
+
+import enum
+
+from .lexer import TokenType
+from .parser import BinOp
+
+# Tipos estáticos das expressões.
+class Type(enum.Enum):
+    INT = 'int'     # Inteiro
+    FLOAT = 'float' # Ponto flutuante
+
+# Infere o tipo de cada nó da AST.
+class TypeChecker:
+    """Passo de inferência de tipos sobre a AST.
+
+    Anota cada nó com o atributo `type`. Uma operação é FLOAT se algum dos
+    operandos for FLOAT; caso contrário é INT (inclusive a divisão, que entre
+    inteiros é truncada).
+    """
+    def check(self, node):
+        """Infere e anota os tipos a partir do nó raiz da AST.
+
+        A travessia (pós-ordem) usa uma pilha explícita em vez de recursão, então
+        cadeias longas como `1 - 1 - ... - 1` não esbarram no limite de recursão.
+
+        Args:
+            node (AST): O nó raiz da AST.
+
+        Returns:
+            Type: O tipo da expressão.
+        """
+        pending = [(node, False)] # (nó, filhos já visitados)
+        while pending:
+            current, children_done = pending.pop()
+            if children_done:
+                self._visit(current)
+            elif isinstance(current, BinOp):
+                pending.append((current, True))
+                pending.append((current.right, False))
+                pending.append((current.left, False))
+            else:
+                self._visit(current)
+        return node.type
+
+    def _visit(self, node):
+        """Chama o método de inferência apropriado; os filhos já estão anotados."""
+        method_name = f'_visit_{type(node).__name__}'
+        visitor = getattr(self, method_name, self._generic_visit)
+        node.type = visitor(node)
+        return node.type
+
+    def _generic_visit(self, node):
+        """Levanta uma exceção para tipos de nós não implementados."""
+        raise Exception(f'Nenhum método _visit_{type(node).__name__} implementado')
+
+    def _visit_BinOp(self, node):
+        """Infere o tipo de uma operação binária a partir dos operandos."""
+        if Type.FLOAT in (node.left.type, node.right.type):
+            return Type.FLOAT
+        return Type.INT
+
+    def _visit_Num(self, node):
+        """Infere o tipo de um número a partir do seu token."""
+        if node.token.type == TokenType.FLOAT:
+            return Type.FLOAT
+        return Type.INT
@@ -0,0 +1,39 @@
+import unittest
+import sys
+import os
+
+# Adiciona o diretório pai (lox/) ao sys.path para permitir importações relativas
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import lox
+from lox.errors import LexerError, ParserError
+
+class TestApi(unittest.TestCase):
+
+    def test_compile(self):
+        result = lox.compile("10 + 2 * 3")
+        self.assertTrue(result.ok)
+        self.assertEqual(result.instructions, ['PUSH 10', 'PUSH 2', 'PUSH 3', 'MUL', 'ADD'])
+
+    def test_compile_options(self):
+        result = lox.compile("1 + 0.5", lox.CompileOptions(specialize=True))
+        self.assertEqual(result.instructions, ['PUSH 1', 'I2F', 'PUSH 0.5', 'FADD'])
+
+    def test_compile_errors(self):
+        result = lox.compile("1 + # 2")
+        self.assertFalse(result.ok)
+        self.assertIsNone(result.instructions)
+        self.assertIsInstance(result.errors[0], LexerError)
+
+        result = lox.compile("(1 2) + * 3", lox.CompileOptions(recover=True))
+        self.assertEqual([type(error) for error in result.errors], [ParserError, ParserError])
+
+    def test_compile_many_from_threads(self):
+        texts = [f"{i} * (2 - {i}) / 3 + 1.5" for i in range(200)]
+        results = lox.compile_many(texts, max_workers=8)
+        self.assertEqual([result.text for result in results], texts)
+        self.assertEqual([result.instructions for result in results],
+                         [lox.compile(text).instructions for text in texts])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import sys
+import os
+
+# Adiciona o diretório pai (lox/) ao sys.path para permitir importações relativas
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import lox
+from lox.lexer import Lexer
+from lox.parser import Parser
+from lox.canonical import Canonicalizer, canonical_key, structural_hash
+from lox.code_generator import CodeGenerator
+from lox.stack_machine import StackMachine
+
+class TestCanonical(unittest.TestCase):
+
+    def key(self, text):
+        return canonical_key(Parser(Lexer(text)).parse())
+
+    def test_equivalent_expressions(self):
+        # A cadeia de inteiros é achatada: uma única soma com três operandos
+        key = self.key("3 + (1 + 2)")
+        self.assertEqual((key.count("("), key.count("+"), sorted(key[3:-1].split())), (1, 1, ["1", "2", "3"]))
+        self.assertEqual(key, self.key("1 + 2 + 3"))
+        self.assertEqual(self.key("(2 + 1) + 3"), self.key("3+1+2"))
+        self.assertEqual(self.key("1 + 2 * 3"), self.key("((3 * 2)) + 1"))
+        self.assertEqual(self.key("4 / 2 * 3"), self.key("3 * (4 / 2)"))
+
+    def test_non_equivalent_expressions(self):
+        self.assertNotEqual(self.key("10 - 2 - 3"), self.key("10 - (2 - 3)"))
+        self.assertNotEqual(self.key("4 / 2"), self.key("2 / 4"))
+        self.assertNotEqual(self.key("1 + 2"), self.key("1 + 2.0"))
+
+    def test_float_addition_is_not_flattened(self):
+        # Soma de ponto flutuante não é associativa: só os dois operandos são ordenados
+        self.assertEqual(self.key("0.5 + (1.5 + 2)"), self.key("(2 + 1.5) + 0.5"))
+        self.assertNotEqual(self.key("(0.5 + 1.5) + 2"), self.key("0.5 + (1.5 + 2)"))
+
+    def test_reduce_key(self):
+        # A chave é a notação prefixada enquanto curta, e um resumo de tamanho fixo depois
+        reduce = lambda text: Canonicalizer().reduce(Parser(Lexer(text)).parse())[0]
+        self.assertEqual(reduce("3 + (2 + 1)"), "(+ 1 2 3)")
+        long_text = " - ".join(str(number) for number in range(50))
+        self.assertEqual(len(reduce(long_text)), 33)
+        self.assertEqual(reduce(f"1 + ({long_text})"), reduce(f"({long_text}) + 1"))
+        self.assertNotEqual(reduce(long_text), reduce(long_text + " - 0"))
+
+    def test_canonical_ast_has_same_value(self):
+        for text in ["3 + (1 + 2) * 4", "(7 - 2) * 5 * (1 + 1)", "2.5 * (4 + 1) / 2", "(0 - 7) / 2 + 1"]:
+            ast = Parser(Lexer(text)).parse()
+            expected = StackMachine().execute(CodeGenerator().generate(ast))
+            _, canonical = Canonicalizer().canonicalize(ast)
+            self.assertEqual(StackMachine().execute(CodeGenerator().generate(canonical)), expected)
+
+    def test_structural_hash(self):
+        ast = Parser(Lexer("2 * (1 + 3)")).parse()
+        self.assertEqual(structural_hash(ast), structural_hash(Parser(Lexer("(3 + 1) * 2")).parse()))
+        self.assertEqual(len(structural_hash(ast)), 64)
+
+    def test_compile_many_dedupe(self):
+        texts = ["1 + 2", "2 + 1", "(1) + 2", "1 - 2", "1 +", "1 + 2"]
+        results = lox.compile_many(texts, dedupe=True)
+        self.assertEqual([result.text for result in results], texts)
+        self.assertEqual(results[0].instructions, results[1].instructions)
+        self.assertEqual(results[0].instructions, results[2].instructions)
+        self.assertEqual(results[3].instructions, ['PUSH 1', 'PUSH 2', 'SUB'])
+        self.assertFalse(results[4].ok)
+        self.assertEqual(results[5].instructions, results[0].instructions)
+
+        # Cada resultado tem a sua própria AST e a sua própria lista de instruções
+        self.assertEqual((results[1].ast.left.value, results[1].ast.left.token.offset), (2, 0))
+        results[0].instructions.append('ADD')
+        self.assertNotEqual(results[1].instructions, results[0].instructions)
+        self.assertNotEqual(results[5].instructions, results[0].instructions)
+
+    def test_compile_many_whitespace_variants(self):
+        # Textos que só diferem nos espaços são analisados uma vez, mas cada um tem a sua AST
+        texts = ["1 + 2 * 3", "1+2*3", " 1 +  2\n* 3", "1 +", "1+"]
+        results = lox.compile_many(texts, dedupe=True)
+        self.assertEqual(results[1].instructions, results[0].instructions)
+        self.assertEqual(results[2].instructions, results[0].instructions)
+        self.assertEqual((results[1].ast.op.offset, results[2].ast.right.op.line), (1, 2))
+        self.assertEqual([error.offset for error in results[3].errors], [3])
+        self.assertEqual([error.offset for error in results[4].errors], [2])
+
+    def test_long_chain(self):
+        # Cadeias longas não esbarram no limite de recursão
+        count = 5 * sys.getrecursionlimit()
+        chain = " - ".join(["1"] * count)
+        self.assertEqual(self.key(chain).count("(-"), count - 1)
+        self.assertEqual(self.key("1 + " + " + ".join(["2"] * count)), self.key(" + ".join(["2"] * count) + " + 1"))
+
+        results = lox.compile_many([chain, "1 + 2", chain + " * 2"], dedupe=True)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(results[0].instructions, lox.compile(chain).instructions)
+        self.assertEqual(StackMachine().execute(results[2].instructions), 1 - count)
+
+    def test_dedupe_failure_is_per_item(self):
+        # Uma falha inesperada em uma expressão não interrompe o lote
+        from unittest import mock
+        with mock.patch.object(Canonicalizer, 'reduce', side_effect=MemoryError("sem memória")):
+            results = lox.compile_many(["1 + 2", "3"], dedupe=True)
+        self.assertEqual([result.ok for result in results], [False, False])
+        self.assertIn("sem memória", str(results[0].errors[0]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import sys
+import os
+
+# Adiciona o diretório pai (lox/) ao sys.path para permitir importações relativas
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lox.lexer import Lexer
+from lox.parser import Parser
+from lox.code_generator import CodeGenerator
+from lox.stack_machine import StackMachine
+from lox.closure_compiler import ClosureCompiler, compile_expression
+from lox.errors import ExecutionError
+
+class TestClosureCompiler(unittest.TestCase):
+
+    def assertMatchesStackMachine(self, text):
+        ast = Parser(Lexer(text)).parse()
+        expected = StackMachine().execute(CodeGenerator().generate(ast))
+        self.assertEqual(ClosureCompiler().compile(ast)(), expected)
+
+    def test_arithmetic(self):
+        for text in ["5", "3 + 5", "10 - 2", "2 + 3 * 4", "(7 - 2) * 5", "(10 + 2) * (5 - 1) / 3"]:
+            self.assertMatchesStackMachine(text)
+
+    def test_division_truncates_toward_zero(self):
+        self.assertMatchesStackMachine("7 / 2")
+        self.assertMatchesStackMachine("(0 - 7) / 2")
+        self.assertMatchesStackMachine("7 / (0 - 2)")
+        self.assertEqual(compile_expression("(0 - 7) / 2")(), -3)
+
+    def test_float_division(self):
+        self.assertMatchesStackMachine("7 / 2.0")
+        self.assertMatchesStackMachine("(7 / 2) / 0.5 + 1")
+        self.assertEqual(compile_expression("7 / 2.0")(), 3.5)
+
+    def test_division_by_zero(self):
+        function = compile_expression("1 / (2 - 2)")
+        with self.assertRaises(ExecutionError):
+            function()
+
+    def test_overflow(self):
+        # Inteiro grande demais para ponto flutuante levanta ExecutionError, como na StackMachine
+        huge = "1" + "0" * 400
+        for text in [huge + " / 2.0", huge + " + 0.5", "(" * 250 + huge + ")" * 250 + " * 1.5"]:
+            ast = Parser(Lexer(text)).parse()
+            for specialize in (False, True):
+                with self.assertRaises(ExecutionError):
+                    StackMachine().execute(CodeGenerator(specialize=specialize).generate(ast))
+            with self.assertRaises(ExecutionError):
+                ClosureCompiler().compile(ast)()
+
+    def test_generated_source(self):
+        ast = Parser(Lexer("(1 + 2) * 3 - 4 / 2 - (5 - 6) + 0.5 / 2")).parse()
+        compiler = ClosureCompiler()
+        function = compiler.compile(ast)
+        self.assertEqual(compiler._source(ast), "(1 + 2) * 3 - _d(4, 2) - (5 - 6) + _fd(0.5, 2)")
+        self.assertEqual(function(), StackMachine().execute(CodeGenerator().generate(ast)))
+
+    def test_deep_nesting_falls_back_to_closures(self):
+        # Aninhamento além do que o compilador do CPython aceita usa closures
+        self.assertMatchesStackMachine("(" * 250 + "8 / 2" + ")" * 250 + " * 3")
+        self.assertMatchesStackMachine(" / ".join(["7"] * 300))
+
+    def test_long_chain(self):
+        # Cadeias longas são compiladas e avaliadas sem recursão proporcional ao tamanho
+        count = 5 * sys.getrecursionlimit()
+        self.assertEqual(compile_expression(" - ".join(["1"] * count) + " / 2.0")(), 2.5 - count)
+        self.assertMatchesStackMachine(" * ".join(["2"] * 10) + " - 3 - (4 - 1)")
+
+    def test_cache(self):
+        self.assertIs(compile_expression("1 + 2"), compile_expression("1 + 2"))
+
+if __name__ == '__main__':
+    unittest.main()
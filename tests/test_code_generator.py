@@ -0,0 +1,55 @@
+import unittest
+import sys
+import os
+import io
+
+# Adiciona o diretório pai (lox/) ao sys.path para permitir importações relativas
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lox.lexer import Lexer
+from lox.parser import Parser
+from lox.code_generator import CodeGenerator
+
+class TestCodeGenerator(unittest.TestCase):
+
+    def parse(self, text):
+        return Parser(Lexer(text)).parse()
+
+    def test_generate(self):
+        ast = self.parse("(10 + 2) * (5 - 1) / 3")
+        self.assertEqual(CodeGenerator().generate(ast), [
+            'PUSH 10', 'PUSH 2', 'ADD', 'PUSH 5', 'PUSH 1', 'SUB', 'MUL', 'PUSH 3', 'DIV'])
+
+    def test_iter_generate_is_lazy(self):
+        instructions = CodeGenerator().iter_generate(self.parse("1 + 2 * 3"))
+        self.assertEqual(next(instructions), 'PUSH 1')
+        self.assertEqual(list(instructions), ['PUSH 2', 'PUSH 3', 'MUL', 'ADD'])
+
+    def test_write_in_chunks(self):
+        ast = self.parse("1 + 2 * 3")
+
+        class Sink:
+            def __init__(self):
+                self.writes = []
+            def write(self, text):
+                self.writes.append(text)
+
+        sink = Sink()
+        CodeGenerator().write(ast, sink, chunk_size=16, indent="  ")
+        self.assertEqual(''.join(sink.writes), "  PUSH 1\n  PUSH 2\n  PUSH 3\n  MUL\n  ADD\n")
+        self.assertEqual(sink.writes[0], "  PUSH 1\n  PUSH 2\n")
+
+    def test_long_chain(self):
+        # Cadeias longas não esbarram no limite de recursão
+        count = 5 * sys.getrecursionlimit()
+        ast = self.parse(" + ".join(["1"] * count))
+        output = io.StringIO()
+        CodeGenerator().write(ast, output)
+        self.assertEqual(output.getvalue().count("\n"), 2 * count - 1)
+
+        output = io.StringIO()
+        CodeGenerator(specialize=True).write(ast, output)
+        self.assertEqual(output.getvalue().count("IADD\n"), count - 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,6 +25,22 @@ class TestLexer(unittest.TestCase):
         self.assertEqual(token.value, 123)
         self.assertEqual(lexer.get_next_token().type, TokenType.EOF)
 
+    def test_float(self):
+        lexer = Lexer("3.25 + 10")
+        token = lexer.get_next_token()
+        self.assertEqual(token.type, TokenType.FLOAT)
+        self.assertEqual(token.value, 3.25)
+        self.assertEqual(token.length, 4)
+        self.assertEqual(lexer.get_next_token().type, TokenType.PLUS)
+        self.assertEqual(lexer.get_next_token().type, TokenType.INTEGER)
+
+    def test_dot_without_fraction(self):
+        # Um ponto sem dígitos depois não faz parte do número
+        lexer = Lexer("1.")
+        self.assertEqual(lexer.get_next_token().type, TokenType.INTEGER)
+        with self.assertRaises(LexerError):
+            lexer.get_next_token()
+
     def test_operators(self):
         # Teste para +, -, *, /
         lexer = Lexer("+ - * /")
@@ -91,6 +107,41 @@ class TestLexer(unittest.TestCase):
         with self.assertRaises(LexerError) as cm: # Usa LexerError
             lexer.get_next_token()
         self.assertIn("Caractere desconhecido", str(cm.exception))
+        self.assertEqual((cm.exception.line, cm.exception.column, cm.exception.offset), (1, 6, 5))
+
+    def test_float_too_large(self):
+        # Literais de ponto flutuante que viram infinito são rejeitados
+        with self.assertRaises(LexerError) as cm:
+            Lexer("1" + "0" * 400 + ".5").get_next_token()
+        self.assertIn("muito grande", str(cm.exception))
+        self.assertEqual((cm.exception.offset, cm.exception.length), (0, 403))
+        lexer = Lexer("2 + " + "9" * 400 + ".0", recover=True)
+        for _ in range(4):
+            lexer.get_next_token()
+        self.assertEqual([error.offset for error in lexer.errors], [4])
+
+    def test_token_positions(self):
+        # Teste para offset, linha e coluna dos tokens
+        lexer = Lexer("12 +\n (3)")
+        positions = [
+            (0, 1, 1, 2),  # 12
+            (3, 1, 4, 1),  # +
+            (6, 2, 2, 1),  # (
+            (7, 2, 3, 1),  # 3
+            (8, 2, 4, 1),  # )
+            (9, 2, 5, 0),  # EOF
+        ]
+        for expected in positions:
+            token = lexer.get_next_token()
+            self.assertEqual((token.offset, token.line, token.column, token.length), expected)
+
+    def test_recover_invalid_characters(self):
+        # No modo de recuperação os caracteres inválidos são registrados e ignorados
+        lexer = Lexer("1 # 2 $", recover=True)
+        self.assertEqual(lexer.get_next_token().value, 1)
+        self.assertEqual(lexer.get_next_token().value, 2)
+        self.assertEqual(lexer.get_next_token().type, TokenType.EOF)
+        self.assertEqual([error.offset for error in lexer.errors], [2, 6])
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,86 @@
+import unittest
+import sys
+import os
+
+# Adiciona o diretório pai (lox/) ao sys.path para permitir importações relativas
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import lox
+from lox.lexer import Lexer
+from lox.parser import Parser, find_errors
+from lox.limits import Limits
+from lox.errors import CompilerError, LexerError, LimitExceededError
+
+class TestLimits(unittest.TestCase):
+
+    def parse(self, text, **limits):
+        return Parser(Lexer(text, limits=Limits(**limits))).parse()
+
+    def test_within_limits(self):
+        self.parse("(1 + 2) * 3.5")
+
+    def test_input_size(self):
+        with self.assertRaises(LimitExceededError):
+            Lexer("1 + 2", limits=Limits(max_input_size=4))
+
+    def test_literal_length(self):
+        with self.assertRaises(LimitExceededError) as cm:
+            self.parse("1 + " + "9" * 100000, max_literal_length=20)
+        self.assertEqual(cm.exception.offset, 4)
+        self.parse("1.5", max_literal_length=3)
+        with self.assertRaises(LimitExceededError):
+            self.parse("1.25", max_literal_length=3)
+
+    def test_nesting_depth(self):
+        self.parse("(" * 10 + "1" + ")" * 10, max_depth=10)
+        with self.assertRaises(LimitExceededError) as cm:
+            self.parse("(" * 5000 + "1" + ")" * 5000, max_depth=10)
+        self.assertEqual(cm.exception.column, 11)
+
+    def test_token_count(self):
+        with self.assertRaises(LimitExceededError):
+            self.parse(" + ".join(["1"] * 100), max_tokens=50)
+        # O EOF não conta como token
+        self.parse("1 + 1", max_tokens=3)
+        with self.assertRaises(LimitExceededError):
+            self.parse("1 + 1 +", max_tokens=3)
+
+    def test_node_count(self):
+        with self.assertRaises(LimitExceededError):
+            self.parse(" * ".join(["1"] * 100), max_nodes=50)
+
+    def test_compile_time(self):
+        with self.assertRaises(LimitExceededError):
+            self.parse(" + ".join(["1"] * 5000), max_compile_time=0)
+
+    def test_compile_api(self):
+        result = lox.compile("(((1)))", lox.CompileOptions(limits=Limits(max_depth=2)))
+        self.assertFalse(result.ok)
+        self.assertIsInstance(result.errors[0], LimitExceededError)
+        self.assertIsInstance(result.errors[0], CompilerError)
+
+    def test_long_chain_with_default_limits(self):
+        # A profundidade da AST em cadeias longas não depende da recursão
+        options = lox.CompileOptions(specialize=True, limits=Limits())
+        result = lox.compile(" - ".join(["1"] * 5000), options)
+        self.assertTrue(result.ok)
+        self.assertEqual(result.instructions[-1], 'ISUB')
+
+    def test_unbounded_input_returns_errors(self):
+        # Sem limites, compile ainda retorna um resultado em vez de levantar exceções
+        result = lox.compile("9" * 5000)
+        self.assertIsInstance(result.errors[0], LexerError)
+        self.assertEqual(result.errors[0].offset, 0)
+
+        result = lox.compile("(" * 5000 + "1" + ")" * 5000)
+        self.assertIsInstance(result.errors[0], LimitExceededError)
+
+    def test_huge_integer_with_recover(self):
+        # O inteiro grande demais é registrado e a análise continua até o próximo erro
+        text = "1 + " + "9" * 5000 + " + * 2"
+        for errors in (find_errors(text), lox.compile(text, lox.CompileOptions(recover=True)).errors):
+            self.assertEqual([error.offset for error in errors], [4, 5007])
+            self.assertIsInstance(errors[0], LexerError)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# Adiciona o diretório pai (lox/) ao sys.path para permitir importações relativas
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lox.line_index import build_index, LineIndex
+
+class TestLineIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "corpus.expr")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, content):
+        with open(self.path, 'wb') as f:
+            f.write(content)
+        build_index(self.path)
+
+    def test_random_access(self):
+        self.write(b"1 + 2\n3 * 4\r\n\n(5 - 1) / 2\n")
+        with LineIndex(self.path) as index:
+            self.assertEqual(len(index), 4)
+            self.assertEqual(index.line(4), "(5 - 1) / 2")
+            self.assertEqual(index.line(2), "3 * 4")
+            self.assertEqual(list(index.lines(2, 3)), [(2, "3 * 4"), (3, "")])
+            with self.assertRaises(IndexError):
+                index.line(5)
+
+    def test_last_line_without_newline(self):
+        self.write(b"1\n2")
+        with LineIndex(self.path) as index:
+            self.assertEqual(list(index.lines(1, 10)), [(1, "1"), (2, "2")])
+
+    def test_shards_are_byte_balanced(self):
+        self.write(b"1\n" * 6 + b"1" * 40 + b"\n" + b"2\n" * 4)
+        with LineIndex(self.path) as index:
+            shards = index.shards(2)
+            self.assertEqual(shards, [(1, 7), (8, 11)])
+            self.assertEqual(index.shards(100)[-1], (11, 11))
+            covered = [number for first, last in index.shards(3) for number in range(first, last + 1)]
+            self.assertEqual(covered, list(range(1, 12)))
+
+    def test_stale_index(self):
+        self.write(b"1 + 2\n")
+        with open(self.path, 'ab') as f:
+            f.write(b"3\n")
+        with self.assertRaises(ValueError):
+            LineIndex(self.path)
+
+    def test_same_size_edit_is_stale(self):
+        self.write(b"1 + 2\n")
+        stat = os.stat(self.path)
+        with open(self.path, 'wb') as f:
+            f.write(b"3 * 4\n")
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        with self.assertRaises(ValueError):
+            LineIndex(self.path)
+
+if __name__ == '__main__':
+    unittest.main()
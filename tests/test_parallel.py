@@ -0,0 +1,41 @@
+import unittest
+import sys
+import os
+
+# Adiciona o diretório pai (lox/) ao sys.path para permitir importações relativas
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lox.lexer import Lexer
+from lox.parser import Parser
+from lox.code_generator import CodeGenerator
+from lox.parallel import split_terms, compile_parallel
+from lox.errors import LexerError, ParserError
+
+class TestParallel(unittest.TestCase):
+
+    def assertSameAsSequential(self, text, specialize=False):
+        expected = CodeGenerator(specialize=specialize).generate(Parser(Lexer(text)).parse())
+        result = compile_parallel(text, jobs=2, specialize=specialize, min_chunk_size=4)
+        self.assertEqual(result, expected)
+
+    def test_split_terms(self):
+        self.assertEqual(split_terms("1 + (2 - 3) * 4 - 5"), [2, 16])
+        self.assertIsNone(split_terms("(1 + 2"))
+        self.assertIsNone(split_terms("1) + (2"))
+
+    def test_left_associative(self):
+        self.assertSameAsSequential("10 - 2 - 3 + 4 * 5 - 6 / 2 - (7 - 8) + 9")
+
+    def test_specialized(self):
+        self.assertSameAsSequential("1 + 2.5 * 2 - 3 / 2 + 4 - 0.5 + (1 - 2) * 3", specialize=True)
+        self.assertSameAsSequential("1.5 + 2 - 3 + 4 * 2 - 7 / 2", specialize=True)
+
+    def test_errors_match_sequential(self):
+        with self.assertRaises(ParserError) as cm:
+            compile_parallel("1 + 2 3 + 4 + 5 + 6 + 7", jobs=2, min_chunk_size=4)
+        self.assertEqual(cm.exception.column, 7)
+        with self.assertRaises(LexerError):
+            compile_parallel("1 + 2 + 3 + 4 # 5 + 6 + 7", jobs=2, min_chunk_size=4)
+
+if __name__ == '__main__':
+    unittest.main()
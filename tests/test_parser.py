@@ -8,8 +8,8 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from lox.lexer import Lexer, TokenType
-from lox.parser import Parser, Num, BinOp
-from lox.errors import ParserError # Importa a exceção personalizada
+from lox.parser import Parser, Num, BinOp, find_errors
+from lox.errors import ParserError, LimitExceededError # Exceções personalizadas
 
 class TestParser(unittest.TestCase):
 
@@ -91,6 +91,32 @@ class TestParser(unittest.TestCase):
         self.assertEqual(right_sub_node.left.value, 2)
         self.assertEqual(right_sub_node.right.value, 1)
 
+    def test_error_position(self):
+        lexer = Lexer("2 + * 3")
+        parser = Parser(lexer)
+        with self.assertRaises(ParserError) as cm:
+            parser.parse()
+        self.assertEqual((cm.exception.line, cm.exception.column, cm.exception.offset), (1, 5, 4))
+
+    def test_recover_reports_all_errors(self):
+        # Todos os erros são encontrados em uma única passada
+        errors = find_errors("(1 2 + 3) + * 4\n+ (5")
+        self.assertTrue(all(isinstance(error, ParserError) for error in errors))
+        self.assertEqual([(error.line, error.column) for error in errors], [(1, 4), (1, 13), (2, 5)])
+
+    def test_recover_fatal_errors_are_reported(self):
+        # Erros que interrompem a análise entram na lista em vez de escapar
+        errors = find_errors("2 + * 3 + " + "(" * 5000 + "1" + ")" * 5000)
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(errors[0].column, 5)
+        self.assertIsInstance(errors[1], LimitExceededError)
+
+    def test_recover_valid_expression(self):
+        parser = Parser(Lexer("10 + 5 * (2 - 1)"), recover=True)
+        ast = parser.parse()
+        self.assertIsInstance(ast, BinOp)
+        self.assertEqual(parser.errors, [])
+
     # def test_missing_rparen_error(self):
     #     # Teste para parêntese não fechado
     #     lexer = Lexer("2 * (3 + 4")
@@ -0,0 +1,58 @@
+import unittest
+import sys
+import os
+
+# Adiciona o diretório pai (lox/) ao sys.path para permitir importações relativas
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lox.lexer import Lexer
+from lox.parser import Parser
+from lox.type_checker import TypeChecker, Type
+from lox.code_generator import CodeGenerator
+from lox.stack_machine import StackMachine
+
+class TestTypeChecker(unittest.TestCase):
+
+    def check(self, text):
+        ast = Parser(Lexer(text)).parse()
+        return ast, TypeChecker().check(ast)
+
+    def test_integer_expression(self):
+        ast, result = self.check("(7 - 2) / 5")
+        self.assertEqual(result, Type.INT)
+        self.assertEqual(ast.left.type, Type.INT)
+
+    def test_float_propagates(self):
+        ast, result = self.check("1 + 2 * 0.5")
+        self.assertEqual(result, Type.FLOAT)
+        self.assertEqual(ast.left.type, Type.INT)
+        self.assertEqual(ast.right.type, Type.FLOAT)
+
+    def test_specialized_instructions(self):
+        ast, _ = self.check("1 + 2.5 * 2")
+        self.assertEqual(CodeGenerator(specialize=True).generate(ast),
+                         ['PUSH 1', 'I2F', 'PUSH 2.5', 'PUSH 2', 'I2F', 'FMUL', 'FADD'])
+
+    def test_specialized_integer_division(self):
+        ast, _ = self.check("(7 / 2) / 0.5")
+        self.assertEqual(CodeGenerator(specialize=True).generate(ast),
+                         ['PUSH 7', 'PUSH 2', 'IDIV', 'I2F', 'PUSH 0.5', 'FDIV'])
+
+    def test_specialized_matches_generic(self):
+        for text in ["10 + 2 * 3", "(0 - 7) / 2", "1.5 - 3", "(10 + 2.5) * (5 - 1) / 3"]:
+            ast, _ = self.check(text)
+            generic = StackMachine().execute(CodeGenerator().generate(ast))
+            specialized = StackMachine().execute(CodeGenerator(specialize=True).generate(ast))
+            self.assertEqual(generic, specialized)
+
+    def test_long_chain(self):
+        # Cadeias longas não esbarram no limite de recursão
+        count = 5 * sys.getrecursionlimit()
+        ast, result = self.check(" - ".join(["1"] * count) + " + 0.5")
+        self.assertEqual(result, Type.FLOAT)
+        instructions = CodeGenerator(specialize=True).generate(ast)
+        self.assertEqual(instructions[-3:], ['I2F', 'PUSH 0.5', 'FADD'])
+        self.assertEqual(StackMachine().execute(instructions), 2.5 - count)
+
+if __name__ == '__main__':
+    unittest.main()